@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from threads._base.auth import BaseAuthClient
+from threads._utils.http import parse_json
 from threads._utils.logger import get_logger
 from threads.constants import API_BASE_URL, API_VERSION
 from threads.exceptions import raise_for_error
@@ -51,7 +52,7 @@ class AsyncAuthClient(BaseAuthClient):
             data=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             logger.error(f"Failed to exchange code: status={response.status_code}")
@@ -85,7 +86,7 @@ class AsyncAuthClient(BaseAuthClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             logger.error(
@@ -119,7 +120,7 @@ class AsyncAuthClient(BaseAuthClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             logger.error(f"Failed to refresh token: status={response.status_code}")
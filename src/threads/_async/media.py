@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from threads._base.media import BaseMediaClient
+from threads._utils.http import parse_json
 from threads._utils.logger import get_logger
 from threads.constants import MediaType, ReplyControl
 from threads.exceptions import raise_for_error
@@ -70,7 +71,7 @@ class AsyncMediaClient(BaseMediaClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             logger.error(f"Failed to create container: status={response.status_code}")
@@ -96,7 +97,7 @@ class AsyncMediaClient(BaseMediaClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             logger.error(
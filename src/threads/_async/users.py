@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from threads._base.users import BaseUsersClient
+from threads._utils.http import parse_json
 from threads._utils.logger import get_logger
 from threads.exceptions import raise_for_error
 from threads.models.user import UserProfile
@@ -46,7 +47,7 @@ class AsyncUsersClient(BaseUsersClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             logger.error(f"Failed to get user profile: status={response.status_code}")
@@ -81,7 +82,7 @@ class AsyncUsersClient(BaseUsersClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             logger.error(f"Failed to get user profile: status={response.status_code}")
@@ -22,6 +22,14 @@ class BaseInsightsClient(BaseSubClient, ABC):
         MetricType.QUOTES,
     ]
 
+    # Metrics summarised by get_engagement
+    ENGAGEMENT_METRICS: ClassVar[list[MetricType]] = [
+        MetricType.LIKES,
+        MetricType.REPLIES,
+        MetricType.REPOSTS,
+        MetricType.QUOTES,
+    ]
+
     # Available metrics for user insights (follower_demographics requires breakdown param)
     USER_METRICS: ClassVar[list[MetricType]] = [
         MetricType.VIEWS,
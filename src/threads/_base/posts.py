@@ -1,11 +1,13 @@
 """Base posts client."""
 
+import random
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Any, ClassVar
 
 from threads._base.client import BaseSubClient, BaseThreadsClient
 from threads._utils.validators import validate_text_length
-from threads.constants import MediaType, ReplyControl
+from threads.constants import POLL_BACKOFF_MULTIPLIER, MediaType, ReplyControl
 
 
 class BasePostsClient(BaseSubClient, ABC):
@@ -157,6 +159,30 @@ class BasePostsClient(BaseSubClient, ABC):
             return MediaType.IMAGE
         return MediaType.TEXT
 
+    def _poll_delays(
+        self,
+        poll_interval: float,
+        max_poll_interval: float,
+    ) -> Iterator[float]:
+        """Yield delays between container status checks.
+
+        The interval starts at poll_interval and doubles up to
+        max_poll_interval. Each delay is jittered to between half and the
+        full interval so concurrent uploads do not poll in lockstep.
+
+        Args:
+            poll_interval: Initial seconds between status checks.
+            max_poll_interval: Upper bound for the interval.
+
+        Yields:
+            Seconds to wait before the next status check.
+        """
+        cap = max(poll_interval, max_poll_interval)
+        interval = poll_interval
+        while True:
+            yield random.uniform(interval / 2, interval)
+            interval = min(interval * POLL_BACKOFF_MULTIPLIER, cap)
+
     def _validate_publish_params(
         self,
         text: str | None,
@@ -53,13 +53,16 @@ class BaseWebhooksClient(BaseSubClient, ABC):
         """
         ...
 
+    @staticmethod
     def verify_challenge(
-        self,
         params: dict[str, str],
         expected_verify_token: str,
     ) -> str | None:
         """Verify a webhook challenge request.
 
+        Needs no client instance, so webhook receivers can call it on the
+        class directly.
+
         Args:
             params: Query parameters from the challenge request.
             expected_verify_token: Your verify token to check against.
@@ -67,26 +70,18 @@ class BaseWebhooksClient(BaseSubClient, ABC):
         Returns:
             The hub.challenge value if verified, None otherwise.
         """
-        try:
-            verification = WebhookVerification(
-                **{
-                    "hub.mode": params.get("hub.mode", ""),
-                    "hub.challenge": params.get("hub.challenge", ""),
-                    "hub.verify_token": params.get("hub.verify_token", ""),
-                }
-            )
-
-            if verification.hub_mode != "subscribe":
-                return None
-
-            if verification.hub_verify_token != expected_verify_token:
-                return None
-
-            return verification.hub_challenge
-        except Exception:
+        verification = WebhookVerification.from_query(params)
+
+        if verification.hub_mode != "subscribe":
             return None
 
-    def parse_payload(self, data: dict[str, Any]) -> WebhookPayload:
+        if verification.hub_verify_token != expected_verify_token:
+            return None
+
+        return verification.hub_challenge
+
+    @staticmethod
+    def parse_payload(data: dict[str, Any]) -> WebhookPayload:
         """Parse a webhook payload.
 
         Args:
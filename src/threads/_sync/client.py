@@ -19,6 +19,8 @@ from threads._utils.logger import get_logger
 from threads.constants import (
     API_BASE_URL,
     API_VERSION,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
     DEFAULT_MAX_RETRIES,
     DEFAULT_TIMEOUT,
 )
@@ -59,6 +61,7 @@ class ThreadsClient(BaseThreadsClient[httpx.Client]):
         base_url: str = API_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        transport: httpx.BaseTransport | None = None,
     ) -> None:
         """Initialize the synchronous Threads client.
 
@@ -67,6 +70,8 @@ class ThreadsClient(BaseThreadsClient[httpx.Client]):
             base_url: Base URL for API requests.
             timeout: Request timeout in seconds.
             max_retries: Maximum retry attempts for failed requests.
+            transport: Custom httpx transport, e.g. ``httpx.MockTransport``
+                for tests. Defaults to an HTTP transport using ``max_retries``.
         """
         super().__init__(
             access_token,
@@ -79,7 +84,16 @@ class ThreadsClient(BaseThreadsClient[httpx.Client]):
             f"Initializing ThreadsClient with base_url={base_url}, timeout={timeout}, max_retries={max_retries}"
         )
 
-        transport = httpx.HTTPTransport(retries=max_retries)
+        if transport is None:
+            # One pooled transport shared by every sub-client; keep idle
+            # connections long enough to be reused between status polls
+            transport = httpx.HTTPTransport(
+                retries=max_retries,
+                limits=httpx.Limits(
+                    max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+                ),
+            )
         self._http_client = httpx.Client(
             base_url=f"{base_url}/{API_VERSION}",
             timeout=timeout,
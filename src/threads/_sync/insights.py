@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from threads._base.insights import BaseInsightsClient
+from threads._utils.http import parse_json
 from threads.constants import MetricType
 from threads.exceptions import raise_for_error
-from threads.models.insights import InsightsResponse, UserInsightsResponse
+from threads.models.insights import (
+    InsightsResponse,
+    UserInsightsResponse,
+    parse_metric,
+    parse_metrics,
+)
 
 if TYPE_CHECKING:
     from threads._sync.client import ThreadsClient
@@ -34,6 +40,23 @@ class InsightsClient(BaseInsightsClient):
         Returns:
             InsightsResponse with the requested metrics.
         """
+        data = self._fetch_media_insights(media_id, metrics)
+        return InsightsResponse.model_validate(data)
+
+    def _fetch_media_insights(
+        self,
+        media_id: str,
+        metrics: list[MetricType] | None,
+    ) -> dict[str, Any]:
+        """Fetch the raw media insights response.
+
+        Args:
+            media_id: The post/media ID.
+            metrics: Specific metrics to retrieve. Defaults to all.
+
+        Returns:
+            The decoded JSON response.
+        """
         metrics_str = self._build_metrics_param(metrics, self.MEDIA_METRICS)
         params = self._get_params(metric=metrics_str)
 
@@ -42,12 +65,12 @@ class InsightsClient(BaseInsightsClient):
             params=params,
         )
 
-        data = response.json()
+        data: dict[str, Any] = parse_json(response)
 
         if response.status_code != 200:
             raise_for_error(data, response.status_code)
 
-        return InsightsResponse.model_validate(data)
+        return data
 
     def get_user_insights(
         self,
@@ -80,7 +103,7 @@ class InsightsClient(BaseInsightsClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             raise_for_error(data, response.status_code)
@@ -96,8 +119,8 @@ class InsightsClient(BaseInsightsClient):
         Returns:
             Number of views.
         """
-        insights = self.get_media_insights(media_id, [MetricType.VIEWS])
-        return insights.views
+        data = self._fetch_media_insights(media_id, [MetricType.VIEWS])
+        return parse_metric(data, MetricType.VIEWS)
 
     def get_engagement(self, media_id: str) -> dict[str, int]:
         """Get all engagement metrics for a post.
@@ -108,19 +131,9 @@ class InsightsClient(BaseInsightsClient):
         Returns:
             Dictionary with likes, replies, reposts, quotes counts.
         """
-        insights = self.get_media_insights(
+        data = self._fetch_media_insights(
             media_id,
-            [
-                MetricType.LIKES,
-                MetricType.REPLIES,
-                MetricType.REPOSTS,
-                MetricType.QUOTES,
-            ],
+            self.ENGAGEMENT_METRICS,
         )
 
-        return {
-            "likes": insights.likes,
-            "replies": insights.replies,
-            "reposts": insights.reposts,
-            "quotes": insights.quotes,
-        }
+        return parse_metrics(data, self.ENGAGEMENT_METRICS)
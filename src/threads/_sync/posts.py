@@ -6,8 +6,13 @@ import time
 from typing import TYPE_CHECKING
 
 from threads._base.posts import BasePostsClient
+from threads._utils.http import parse_json
 from threads._utils.logger import get_logger
-from threads.constants import ContainerStatus, ReplyControl
+from threads.constants import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    ContainerStatus,
+    ReplyControl,
+)
 from threads.exceptions import ContainerError, raise_for_error
 from threads.models.post import Post, PublishingLimit
 
@@ -51,7 +56,7 @@ class PostsClient(BasePostsClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             logger.error(f"Failed to publish container: status={response.status_code}")
@@ -83,6 +88,7 @@ class PostsClient(BasePostsClient):
         wait_for_ready: bool = True,
         poll_interval: float = 1.0,
         max_wait_time: float = 60.0,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
     ) -> Post:
         """Create a container and publish it in one call.
 
@@ -94,8 +100,9 @@ class PostsClient(BasePostsClient):
             reply_to_id: Post ID to reply to.
             reply_control: Who can reply.
             wait_for_ready: Wait for video processing to complete.
-            poll_interval: Seconds between status checks.
+            poll_interval: Initial seconds between status checks.
             max_wait_time: Maximum seconds to wait for processing.
+            max_poll_interval: Upper bound for the backoff between checks.
 
         Returns:
             Post with the published post data.
@@ -121,6 +128,7 @@ class PostsClient(BasePostsClient):
                 container.id,
                 poll_interval=poll_interval,
                 max_wait_time=max_wait_time,
+                max_poll_interval=max_poll_interval,
             )
 
         return self.publish(user_id, container.id)
@@ -130,13 +138,15 @@ class PostsClient(BasePostsClient):
         container_id: str,
         poll_interval: float = 1.0,
         max_wait_time: float = 60.0,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
     ) -> MediaContainerStatus:
         """Wait for a container to be ready for publishing.
 
         Args:
             container_id: The container ID to check.
-            poll_interval: Seconds between status checks.
+            poll_interval: Initial seconds between status checks.
             max_wait_time: Maximum seconds to wait.
+            max_poll_interval: Upper bound for the backoff between checks.
 
         Returns:
             MediaContainerStatus when ready.
@@ -145,6 +155,7 @@ class PostsClient(BasePostsClient):
             ContainerError: If container fails or times out.
         """
         start_time = time.time()
+        delays = self._poll_delays(poll_interval, max_poll_interval)
         logger.debug(f"Starting to poll container {container_id} status")
 
         while True:
@@ -176,7 +187,7 @@ class PostsClient(BasePostsClient):
                     f"(status: {status.status})"
                 )
 
-            time.sleep(poll_interval)
+            time.sleep(min(next(delays), max_wait_time - elapsed))
 
     def get(
         self,
@@ -202,7 +213,7 @@ class PostsClient(BasePostsClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             raise_for_error(data, response.status_code)
@@ -245,7 +256,7 @@ class PostsClient(BasePostsClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             raise_for_error(data, response.status_code)
@@ -269,7 +280,7 @@ class PostsClient(BasePostsClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             logger.error(f"Failed to delete post: status={response.status_code}")
@@ -294,7 +305,7 @@ class PostsClient(BasePostsClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             raise_for_error(data, response.status_code)
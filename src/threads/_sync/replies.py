@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from threads._base.replies import BaseRepliesClient
+from threads._utils.http import parse_json
 from threads.exceptions import raise_for_error
 from threads.models.post import Reply
 
@@ -49,7 +50,7 @@ class RepliesClient(BaseRepliesClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             raise_for_error(data, response.status_code)
@@ -86,7 +87,7 @@ class RepliesClient(BaseRepliesClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             raise_for_error(data, response.status_code)
@@ -109,7 +110,7 @@ class RepliesClient(BaseRepliesClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             raise_for_error(data, response.status_code)
@@ -132,7 +133,7 @@ class RepliesClient(BaseRepliesClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             raise_for_error(data, response.status_code)
@@ -175,7 +176,7 @@ class RepliesClient(BaseRepliesClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             raise_for_error(data, response.status_code)
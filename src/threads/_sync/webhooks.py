@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from threads._base.webhooks import BaseWebhooksClient
+from threads._utils.http import parse_json
 from threads.exceptions import raise_for_error
 from threads.models.webhook import WebhookSubscription
 
@@ -50,7 +51,7 @@ class WebhooksClient(BaseWebhooksClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             raise_for_error(data, response.status_code)
@@ -75,7 +76,7 @@ class WebhooksClient(BaseWebhooksClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             raise_for_error(data, response.status_code)
@@ -95,7 +96,7 @@ class WebhooksClient(BaseWebhooksClient):
             params=params,
         )
 
-        data = response.json()
+        data = parse_json(response)
 
         if response.status_code != 200:
             raise_for_error(data, response.status_code)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlencode, urljoin
 
@@ -9,9 +10,24 @@ from threads.constants import API_BASE_URL, API_VERSION
 from threads.exceptions import raise_for_error
 
 if TYPE_CHECKING:
+    from types import ModuleType
+
+    import httpx
+
     from threads.types import JSON, QueryParams
 
 
+def _load_orjson() -> ModuleType | None:
+    """Import orjson if the optional speedups extra is installed."""
+    try:
+        return importlib.import_module("orjson")
+    except ImportError:
+        return None
+
+
+_orjson = _load_orjson()
+
+
 def build_url(
     endpoint: str,
     path_params: dict[str, str] | None = None,
@@ -91,3 +107,20 @@ def prepare_request_params(
     if extra_params:
         params.update({k: v for k, v in extra_params.items() if v is not None})
     return params
+
+
+def parse_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body.
+
+    Uses orjson when it is installed and falls back to httpx's stdlib
+    decoder otherwise.
+
+    Args:
+        response: The HTTP response to decode.
+
+    Returns:
+        The decoded JSON value.
+    """
+    if _orjson is not None:
+        return _orjson.loads(response.content)
+    return response.json()
@@ -1,7 +1,9 @@
 """Rate limiting utilities for the Threads SDK."""
 
+import asyncio
 import time
 from collections import deque
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from threading import Lock
 
@@ -11,17 +13,21 @@ class RateLimiter:
     """Thread-safe rate limiter using sliding window.
 
     Tracks requests within a time window to prevent exceeding API limits.
+    The clock and sleep functions can be swapped out to drive the window
+    deterministically in tests.
     """
 
     max_requests: int
     window_seconds: float = 86400.0  # 24 hours default
+    time_func: Callable[[], float] = field(default=time.monotonic, repr=False)
+    sleep_func: Callable[[float], None] = field(default=time.sleep, repr=False)
     _timestamps: deque[float] = field(default_factory=deque)
     _lock: Lock = field(default_factory=Lock)
 
     def _cleanup_old_timestamps(self, now: float) -> None:
         """Remove timestamps outside the current window."""
         cutoff = now - self.window_seconds
-        while self._timestamps and self._timestamps[0] < cutoff:
+        while self._timestamps and self._timestamps[0] <= cutoff:
             self._timestamps.popleft()
 
     def can_proceed(self) -> bool:
@@ -31,14 +37,14 @@ class RateLimiter:
             True if request can proceed, False otherwise.
         """
         with self._lock:
-            now = time.time()
+            now = self.time_func()
             self._cleanup_old_timestamps(now)
             return len(self._timestamps) < self.max_requests
 
     def record_request(self) -> None:
         """Record that a request was made."""
         with self._lock:
-            self._timestamps.append(time.time())
+            self._timestamps.append(self.time_func())
 
     def wait_if_needed(self) -> float:
         """Wait until a request can proceed.
@@ -47,7 +53,7 @@ class RateLimiter:
             Time waited in seconds (0 if no wait needed).
         """
         with self._lock:
-            now = time.time()
+            now = self.time_func()
             self._cleanup_old_timestamps(now)
 
             if len(self._timestamps) < self.max_requests:
@@ -56,24 +62,25 @@ class RateLimiter:
             oldest = self._timestamps[0]
             wait_time = (oldest + self.window_seconds) - now
 
-            if wait_time > 0:
-                time.sleep(wait_time)
-                return wait_time
+        # Sleep outside the lock so other threads are not blocked meanwhile
+        if wait_time > 0:
+            self.sleep_func(wait_time)
+            return wait_time
 
-            return 0.0
+        return 0.0
 
     @property
     def remaining(self) -> int:
         """Get remaining requests allowed in current window."""
         with self._lock:
-            self._cleanup_old_timestamps(time.time())
+            self._cleanup_old_timestamps(self.time_func())
             return max(0, self.max_requests - len(self._timestamps))
 
     @property
     def usage(self) -> int:
         """Get current usage count in the window."""
         with self._lock:
-            self._cleanup_old_timestamps(time.time())
+            self._cleanup_old_timestamps(self.time_func())
             return len(self._timestamps)
 
     def reset(self) -> None:
@@ -89,32 +96,35 @@ class AsyncRateLimiter:
         self,
         max_requests: int,
         window_seconds: float = 86400.0,
+        *,
+        time_func: Callable[[], float] = time.monotonic,
+        sleep_func: Callable[[float], Awaitable[None]] = asyncio.sleep,
     ) -> None:
         self.max_requests = max_requests
         self.window_seconds = window_seconds
+        self.time_func = time_func
+        self.sleep_func = sleep_func
         self._timestamps: deque[float] = deque()
 
     def _cleanup_old_timestamps(self, now: float) -> None:
         """Remove timestamps outside the current window."""
         cutoff = now - self.window_seconds
-        while self._timestamps and self._timestamps[0] < cutoff:
+        while self._timestamps and self._timestamps[0] <= cutoff:
             self._timestamps.popleft()
 
     def can_proceed(self) -> bool:
         """Check if a request can proceed without exceeding limits."""
-        now = time.time()
+        now = self.time_func()
         self._cleanup_old_timestamps(now)
         return len(self._timestamps) < self.max_requests
 
     def record_request(self) -> None:
         """Record that a request was made."""
-        self._timestamps.append(time.time())
+        self._timestamps.append(self.time_func())
 
     async def wait_if_needed(self) -> float:
         """Wait until a request can proceed (async version)."""
-        import asyncio
-
-        now = time.time()
+        now = self.time_func()
         self._cleanup_old_timestamps(now)
 
         if len(self._timestamps) < self.max_requests:
@@ -124,7 +134,7 @@ class AsyncRateLimiter:
         wait_time = (oldest + self.window_seconds) - now
 
         if wait_time > 0:
-            await asyncio.sleep(wait_time)
+            await self.sleep_func(wait_time)
             return wait_time
 
         return 0.0
@@ -132,7 +142,7 @@ class AsyncRateLimiter:
     @property
     def remaining(self) -> int:
         """Get remaining requests allowed in current window."""
-        self._cleanup_old_timestamps(time.time())
+        self._cleanup_old_timestamps(self.time_func())
         return max(0, self.max_requests - len(self._timestamps))
 
     def reset(self) -> None:
@@ -1,20 +1,42 @@
 """Input validators for the Threads SDK."""
 
 import re
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
-from threads.constants import MediaType
+from threads.constants import MediaType, ReplyControl
 from threads.exceptions import ValidationError
 
 # Threads text post limit
 MAX_TEXT_LENGTH = 500
 
+# Carousel item count bounds
+MIN_CAROUSEL_ITEMS = 2
+MAX_CAROUSEL_ITEMS = 20
+
 # Supported image formats
 SUPPORTED_IMAGE_FORMATS = {"jpg", "jpeg", "png", "gif", "webp"}
 
 # Supported video formats
 SUPPORTED_VIDEO_FORMATS = {"mp4", "mov"}
 
+# Media types that need a URL, mapped to their supported formats
+_SUPPORTED_FORMATS = {
+    MediaType.IMAGE: SUPPORTED_IMAGE_FORMATS,
+    MediaType.VIDEO: SUPPORTED_VIDEO_FORMATS,
+}
+
+# Schemes accepted for media URLs
+_URL_SCHEMES = frozenset({"http", "https"})
+
+# Accepted reply_control values
+REPLY_CONTROL_VALUES = frozenset(m.value for m in ReplyControl)
+
+# ISO 3166-1 alpha-2 country code, matched against the whole string
+_ISO_COUNTRY_CODE = re.compile(r"[A-Z]{2}")
+
+# Comma-joined list of ISO country codes, checked in a single regex call
+_ISO_COUNTRY_CODE_LIST = re.compile(r"[A-Z]{2}(?:,[A-Z]{2})*")
+
 
 def validate_text_length(text: str | None, max_length: int = MAX_TEXT_LENGTH) -> None:
     """Validate that text doesn't exceed maximum length.
@@ -26,10 +48,7 @@ def validate_text_length(text: str | None, max_length: int = MAX_TEXT_LENGTH) ->
     Raises:
         ValidationError: If text exceeds maximum length.
     """
-    if text is None:
-        return
-
-    if len(text) > max_length:
+    if text is not None and len(text) > max_length:
         raise ValidationError(
             f"Text exceeds maximum length of {max_length} characters "
             f"(got {len(text)} characters)"
@@ -49,38 +68,31 @@ def validate_media_url(
     Raises:
         ValidationError: If URL is invalid or doesn't match expected type.
     """
+    formats = _SUPPORTED_FORMATS.get(media_type)
+
     if url is None:
-        if media_type in (MediaType.IMAGE, MediaType.VIDEO):
+        if formats is not None:
             raise ValidationError(f"URL is required for {media_type} posts")
         return
 
-    parsed = urlparse(url)
+    parsed = urlsplit(url)
 
     if not parsed.scheme or not parsed.netloc:
         raise ValidationError(f"Invalid URL format: {url}")
 
-    if parsed.scheme not in ("http", "https"):
+    if parsed.scheme not in _URL_SCHEMES:
         raise ValidationError(f"URL must use http or https scheme: {url}")
 
-    extension = parsed.path.rsplit(".", 1)[-1].lower() if "." in parsed.path else ""
+    if formats is None:
+        return
 
-    if (
-        media_type == MediaType.IMAGE
-        and extension
-        and extension not in SUPPORTED_IMAGE_FORMATS
-    ):
-        raise ValidationError(
-            f"Unsupported image format: {extension}. "
-            f"Supported: {', '.join(SUPPORTED_IMAGE_FORMATS)}"
-        )
-    elif (
-        media_type == MediaType.VIDEO
-        and extension
-        and extension not in SUPPORTED_VIDEO_FORMATS
-    ):
+    _, dot, extension = parsed.path.rpartition(".")
+    extension = extension.lower() if dot else ""
+
+    if extension and extension not in formats:
         raise ValidationError(
-            f"Unsupported video format: {extension}. "
-            f"Supported: {', '.join(SUPPORTED_VIDEO_FORMATS)}"
+            f"Unsupported {media_type.lower()} format: {extension}. "
+            f"Supported: {', '.join(formats)}"
         )
 
 
@@ -93,11 +105,15 @@ def validate_carousel_items(item_ids: list[str]) -> None:
     Raises:
         ValidationError: If carousel requirements aren't met.
     """
-    if len(item_ids) < 2:
-        raise ValidationError("Carousel requires at least 2 items")
+    count = len(item_ids)
 
-    if len(item_ids) > 20:
-        raise ValidationError("Carousel cannot have more than 20 items")
+    if count < MIN_CAROUSEL_ITEMS:
+        raise ValidationError(f"Carousel requires at least {MIN_CAROUSEL_ITEMS} items")
+
+    if count > MAX_CAROUSEL_ITEMS:
+        raise ValidationError(
+            f"Carousel cannot have more than {MAX_CAROUSEL_ITEMS} items"
+        )
 
 
 def validate_reply_control(reply_control: str | None) -> None:
@@ -109,12 +125,10 @@ def validate_reply_control(reply_control: str | None) -> None:
     Raises:
         ValidationError: If reply control value is invalid.
     """
-    valid_values = {"EVERYONE", "ACCOUNTS_YOU_FOLLOW", "MENTIONED_ONLY"}
-
-    if reply_control is not None and reply_control not in valid_values:
+    if reply_control is not None and reply_control not in REPLY_CONTROL_VALUES:
         raise ValidationError(
             f"Invalid reply_control value: {reply_control}. "
-            f"Must be one of: {', '.join(valid_values)}"
+            f"Must be one of: {', '.join(sorted(REPLY_CONTROL_VALUES))}"
         )
 
 
@@ -130,9 +144,13 @@ def validate_country_codes(codes: list[str] | None) -> None:
     if codes is None:
         return
 
-    iso_pattern = re.compile(r"^[A-Z]{2}$")
+    # A full match of n codes is exactly 3n - 1 characters, which rules out
+    # a single element smuggling in a comma
+    joined = ",".join(codes)
+    if len(joined) == 3 * len(codes) - 1 and _ISO_COUNTRY_CODE_LIST.fullmatch(joined):
+        return
 
-    invalid_codes = [code for code in codes if not iso_pattern.match(code)]
+    invalid_codes = [code for code in codes if not _ISO_COUNTRY_CODE.fullmatch(code)]
 
     if invalid_codes:
         raise ValidationError(
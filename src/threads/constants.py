@@ -71,3 +71,9 @@ class ContainerStatus(StrEnum):
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+
+# Container status polling
+DEFAULT_MAX_POLL_INTERVAL = 10.0
+POLL_BACKOFF_MULTIPLIER = 2.0
@@ -1,11 +1,18 @@
 """Exception hierarchy for the Threads API SDK."""
 
-from typing import Any
+import random
+from typing import Any, ClassVar
 
 from threads._utils.logger import get_logger
+from threads.constants import DEFAULT_RETRY_DELAY
 
 logger = get_logger("exceptions")
 
+# Graph API error codes mapped to exception types in raise_for_error
+_AUTHENTICATION_ERROR_CODES = frozenset({190, 102})
+_AUTHORIZATION_ERROR_CODES = frozenset({10, 200, 294})
+_RATE_LIMIT_ERROR_CODES = frozenset({4, 17, 32, 613})
+
 
 class ThreadsError(Exception):
     """Base exception for all Threads SDK errors."""
@@ -56,6 +63,10 @@ class AuthorizationError(ThreadsAPIError):
 class RateLimitError(ThreadsAPIError):
     """Raised when API rate limits are exceeded."""
 
+    # Backoff settings used by next_delay when no retry_after is given
+    BACKOFF_BASE: ClassVar[float] = DEFAULT_RETRY_DELAY
+    BACKOFF_CAP: ClassVar[float] = 30.0
+
     def __init__(
         self,
         message: str,
@@ -65,6 +76,25 @@ class RateLimitError(ThreadsAPIError):
         self.retry_after = retry_after
         super().__init__(message, **kwargs)
 
+    def next_delay(self, attempt: int) -> float:
+        """Get the number of seconds to wait before retrying.
+
+        Honors retry_after when the API provided one. Otherwise uses
+        exponential backoff capped at BACKOFF_CAP with full jitter.
+
+        Args:
+            attempt: Zero-based retry attempt number.
+
+        Returns:
+            Delay in seconds.
+        """
+        if self.retry_after:
+            return float(self.retry_after)
+        # Clamp the exponent so large attempt counts cannot overflow a float
+        exponent = min(max(0, attempt), 32)
+        ceiling = min(self.BACKOFF_CAP, self.BACKOFF_BASE * (1 << exponent))
+        return random.uniform(0.0, ceiling)
+
 
 class NotFoundError(ThreadsAPIError):
     """Raised when a requested resource is not found."""
@@ -121,13 +151,13 @@ def raise_for_error(response_data: dict[str, Any], status_code: int) -> None:
         f"API error: status={status_code}, code={error_code}, subcode={error_subcode}, message={message}"
     )
 
-    if status_code == 401 or error_code in (190, 102):
+    if status_code == 401 or error_code in _AUTHENTICATION_ERROR_CODES:
         logger.warning(f"Authentication error: {message}")
         raise AuthenticationError(message, **common_kwargs)
-    if status_code == 403 or error_code in (10, 200, 294):
+    if status_code == 403 or error_code in _AUTHORIZATION_ERROR_CODES:
         logger.warning(f"Authorization error: {message}")
         raise AuthorizationError(message, **common_kwargs)
-    if status_code == 429 or error_code in (4, 17, 32, 613):
+    if status_code == 429 or error_code in _RATE_LIMIT_ERROR_CODES:
         logger.warning(f"Rate limit exceeded: {message}")
         raise RateLimitError(message, **common_kwargs)
     if status_code == 404:
@@ -2,31 +2,94 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterable
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from threads.constants import MetricType
 
+# Shared string for the period reported by media insights
+_LIFETIME = sys.intern("lifetime")
+
 
 class Insight(BaseModel):
     """A single insight metric."""
 
     name: MetricType
-    period: str = "lifetime"
+    period: str = _LIFETIME
     values: list[dict[str, int | str]]
     title: str | None = None
     description: str | None = None
     id: str | None = None
 
+    @field_validator("period")
+    @classmethod
+    def intern_period(cls, v: str) -> str:
+        """Share one string object for the decoded period."""
+        return sys.intern(v)
+
     @property
     def value(self) -> int:
         """Get the primary value for this metric."""
-        if self.values and len(self.values) > 0:
+        if self.values:
             return int(self.values[0].get("value", 0))
         return 0
 
 
+def parse_metric(data: dict[str, Any], metric: MetricType | str) -> int:
+    """Extract a single metric value from a raw insights response.
+
+    Reads the decoded JSON directly instead of building an InsightsResponse,
+    for callers that only need one number.
+
+    Args:
+        data: Decoded insights response with a "data" list.
+        metric: The metric name to look up.
+
+    Returns:
+        The metric value, or 0 if the metric is not present.
+    """
+    for item in data.get("data", []):
+        if item.get("name") == metric:
+            values = item.get("values")
+            if values:
+                return int(values[0].get("value", 0))
+            return 0
+    return 0
+
+
+def parse_metrics(
+    data: dict[str, Any], metrics: Iterable[MetricType | str]
+) -> dict[str, int]:
+    """Extract several metric values from a raw insights response.
+
+    Walks the "data" list once and stops as soon as every requested metric
+    has been seen, instead of scanning it once per metric.
+
+    Args:
+        data: Decoded insights response with a "data" list.
+        metrics: The metric names to look up.
+
+    Returns:
+        Mapping of metric name to value, with 0 for metrics not present.
+    """
+    result = dict.fromkeys(map(str, metrics), 0)
+    pending = set(result)
+    for item in data.get("data", []):
+        name = item.get("name")
+        if name in pending:
+            values = item.get("values")
+            if values:
+                result[name] = int(values[0].get("value", 0))
+            pending.discard(name)
+            if not pending:
+                break
+    return result
+
+
 class InsightsResponse(BaseModel):
     """Response containing media insights."""
 
@@ -14,7 +14,11 @@ class MediaContainer(BaseModel):
 
 
 class MediaContainerStatus(BaseModel):
-    """Status of a media container."""
+    """Status of a media container.
+
+    Validation coerces the wire string into a ContainerStatus member, and
+    the status checks below compare it with ==.
+    """
 
     id: str
     status: ContainerStatus
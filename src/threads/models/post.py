@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime
 from typing import Any
 
@@ -9,12 +10,15 @@ from pydantic import BaseModel, Field, field_validator
 
 from threads.constants import MediaType, ReplyControl
 
+# Shared string for the product type every Threads post carries
+_THREADS = sys.intern("THREADS")
+
 
 class Post(BaseModel):
     """A Threads post."""
 
     id: str
-    media_product_type: str = "THREADS"
+    media_product_type: str = _THREADS
     media_type: MediaType
     media_url: str | None = None
     permalink: str | None = None
@@ -38,6 +42,12 @@ class Post(BaseModel):
     reply_audience: ReplyControl | None = None
     hide_status: str | None = None
 
+    @field_validator("media_product_type")
+    @classmethod
+    def intern_media_product_type(cls, v: str) -> str:
+        """Share one string object for the decoded product type."""
+        return sys.intern(v)
+
     @field_validator("children", mode="before")
     @classmethod
     def extract_children_data(cls, v: Any) -> list[dict[str, str]] | None:
@@ -94,3 +104,8 @@ class PublishingLimit(BaseModel):
         if self.reply_quota_usage is None or self.reply_quota_total is None:
             return None
         return max(0, self.reply_quota_total - self.reply_quota_usage)
+
+    @property
+    def remaining(self) -> tuple[int, int | None]:
+        """Get remaining posts and replies as a single tuple."""
+        return self.remaining_posts, self.remaining_replies
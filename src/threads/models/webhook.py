@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
 
 
 class WebhookSubscription(BaseModel):
@@ -46,11 +48,30 @@ class WebhookEvent(BaseModel):
     data: dict[str, str | int | bool | None] = Field(default_factory=dict)
 
 
-class WebhookVerification(BaseModel):
-    """Webhook verification challenge."""
+@dataclass(slots=True, frozen=True)
+class WebhookVerification:
+    """Webhook verification challenge.
 
-    model_config = ConfigDict(populate_by_name=True)
+    A plain dataclass rather than a pydantic model: the three hub.* query
+    parameters need no validation, only renaming.
+    """
 
-    hub_mode: str = Field(alias="hub.mode")
-    hub_challenge: str = Field(alias="hub.challenge")
-    hub_verify_token: str = Field(alias="hub.verify_token")
+    hub_mode: str
+    hub_challenge: str
+    hub_verify_token: str
+
+    @classmethod
+    def from_query(cls, params: Mapping[str, str]) -> WebhookVerification:
+        """Build from the challenge request's query parameters.
+
+        Args:
+            params: Query parameters containing the hub.* keys.
+
+        Returns:
+            WebhookVerification with missing keys set to empty strings.
+        """
+        return cls(
+            hub_mode=params.get("hub.mode", ""),
+            hub_challenge=params.get("hub.challenge", ""),
+            hub_verify_token=params.get("hub.verify_token", ""),
+        )
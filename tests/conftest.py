@@ -1,11 +1,35 @@
 """Shared test fixtures."""
 
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+
 import pytest
 
 from threads import AsyncThreadsClient, ThreadsClient
 
+# Shared helpers assert on their own, so let pytest rewrite them for diffs
+pytest.register_assert_rewrite("tests.unit._fixtures")
 
-@pytest.fixture
+# Marker applied to every test collected from each top-level test directory
+_DIRECTORY_MARKERS = {
+    "unit": pytest.mark.unit,
+    "integration": pytest.mark.integration,
+}
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Mark tests by directory so "-m unit" or "-m integration" selects them."""
+    tests_root = Path(__file__).parent
+    for item in items:
+        if not item.path.is_relative_to(tests_root):
+            continue
+        relative = item.path.relative_to(tests_root)
+        marker = _DIRECTORY_MARKERS.get(relative.parts[0])
+        if marker is not None:
+            item.add_marker(marker)
+
+
+@pytest.fixture(scope="session")
 def access_token() -> str:
     """Fixture providing a test access token."""
     return "test_access_token_123"
@@ -18,15 +42,17 @@ def user_id() -> str:
 
 
 @pytest.fixture
-def client(access_token: str) -> ThreadsClient:
-    """Fixture providing a sync ThreadsClient."""
-    return ThreadsClient(access_token=access_token)
+def fresh_sync_client(access_token: str) -> Iterator[ThreadsClient]:
+    """Fixture providing a ThreadsClient closed when the test finishes."""
+    with ThreadsClient(access_token=access_token) as client:
+        yield client
 
 
 @pytest.fixture
-async def async_client(access_token: str) -> AsyncThreadsClient:
-    """Fixture providing an async ThreadsClient."""
-    return AsyncThreadsClient(access_token=access_token)
+async def fresh_async_client(access_token: str) -> AsyncIterator[AsyncThreadsClient]:
+    """Fixture providing an AsyncThreadsClient closed when the test finishes."""
+    async with AsyncThreadsClient(access_token=access_token) as client:
+        yield client
 
 
 @pytest.fixture
@@ -13,8 +13,8 @@ if TYPE_CHECKING:
 class TestAuthorizationUrl:
     """Tests for authorization URL generation."""
 
-    def test_generate_auth_url(self, client: ThreadsClient):
-        url = client.auth.get_authorization_url(
+    def test_generate_auth_url(self, fresh_sync_client: ThreadsClient):
+        url = fresh_sync_client.auth.get_authorization_url(
             client_id="app_123",
             redirect_uri="https://example.com/callback",
         )
@@ -23,10 +23,9 @@ class TestAuthorizationUrl:
         assert "client_id=app_123" in url
         assert "redirect_uri=https://example.com/callback" in url
         assert "response_type=code" in url
-        client.close()
 
-    def test_auth_url_with_scopes(self, client: ThreadsClient):
-        url = client.auth.get_authorization_url(
+    def test_auth_url_with_scopes(self, fresh_sync_client: ThreadsClient):
+        url = fresh_sync_client.auth.get_authorization_url(
             client_id="app_123",
             redirect_uri="https://example.com/callback",
             scopes=[Scope.BASIC, Scope.CONTENT_PUBLISH, Scope.MANAGE_INSIGHTS],
@@ -35,14 +34,12 @@ class TestAuthorizationUrl:
         assert "threads_basic" in url
         assert "threads_content_publish" in url
         assert "threads_manage_insights" in url
-        client.close()
 
-    def test_auth_url_with_state(self, client: ThreadsClient):
-        url = client.auth.get_authorization_url(
+    def test_auth_url_with_state(self, fresh_sync_client: ThreadsClient):
+        url = fresh_sync_client.auth.get_authorization_url(
             client_id="app_123",
             redirect_uri="https://example.com/callback",
             state="random_state_123",
         )
 
         assert "state=random_state_123" in url
-        client.close()
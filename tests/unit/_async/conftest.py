@@ -0,0 +1,114 @@
+"""Shared fixtures for asynchronous client tests."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any
+from unittest.mock import create_autospec
+
+import httpx
+import pytest
+import pytest_asyncio
+import respx
+
+from tests.unit._fixtures import (
+    CONTAINER_BODY,
+    CONTAINER_FINISHED_BODY,
+    LONG_LIVED_TOKEN_BODY,
+    ME_BODY,
+    MEDIA_INSIGHTS_BODY,
+    POST_123_BODY,
+    REFRESHED_TOKEN_BODY,
+    REPLIES_BODY,
+    SHORT_LIVED_TOKEN_BODY,
+    SUCCESS_BODY,
+    USER_123_BODY,
+    USER_456_BODY,
+    USER_POSTS_BODY,
+    json_response,
+)
+from threads import AsyncThreadsClient
+from threads.constants import API_VERSION
+
+_TOKEN = "test_token"
+
+# Canned happy-path responses keyed by (method, URL path)
+ROUTES: dict[tuple[str, str], bytes] = {
+    ("POST", "/oauth/access_token"): SHORT_LIVED_TOKEN_BODY,
+    ("GET", f"/{API_VERSION}/access_token"): LONG_LIVED_TOKEN_BODY,
+    ("GET", f"/{API_VERSION}/refresh_access_token"): REFRESHED_TOKEN_BODY,
+    ("GET", f"/{API_VERSION}/post_123"): POST_123_BODY,
+    ("GET", f"/{API_VERSION}/user_123/threads"): USER_POSTS_BODY,
+    ("POST", f"/{API_VERSION}/user_123/threads"): CONTAINER_BODY,
+    ("GET", f"/{API_VERSION}/container_123"): CONTAINER_FINISHED_BODY,
+    ("GET", f"/{API_VERSION}/post_123/insights"): MEDIA_INSIGHTS_BODY,
+    ("GET", f"/{API_VERSION}/post_123/replies"): REPLIES_BODY,
+    ("POST", f"/{API_VERSION}/reply_123/manage_reply"): SUCCESS_BODY,
+    ("POST", f"/{API_VERSION}/me/subscribed_apps"): SUCCESS_BODY,
+    ("DELETE", f"/{API_VERSION}/me/subscribed_apps"): SUCCESS_BODY,
+    ("GET", f"/{API_VERSION}/me"): ME_BODY,
+    ("GET", f"/{API_VERSION}/user_123"): USER_123_BODY,
+    ("GET", f"/{API_VERSION}/user_456"): USER_456_BODY,
+}
+
+
+_real_sleep = asyncio.sleep
+
+
+async def _instant_sleep(delay: float, result: Any = None) -> Any:
+    """Yield to the event loop once instead of waiting for ``delay``."""
+    return await _real_sleep(0, result)
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Answer a request from ROUTES, ignoring the query string."""
+    return json_response(ROUTES[(request.method, request.url.path)])
+
+
+@pytest.fixture(autouse=True)
+def fast_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make asyncio.sleep return immediately so polling never waits in tests."""
+    monkeypatch.setattr(asyncio, "sleep", _instant_sleep)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def transport_client() -> AsyncIterator[AsyncThreadsClient]:
+    """Provide a session AsyncThreadsClient served by an httpx.MockTransport.
+
+    Requests are answered from ROUTES without respx, so this client suits
+    happy-path tests that do not assert on URL patterns or query strings.
+    """
+    transport = httpx.MockTransport(_handler)
+    async with AsyncThreadsClient(access_token=_TOKEN, transport=transport) as client:
+        yield client
+
+
+@pytest.fixture
+def stub_async_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[..., AsyncThreadsClient]:
+    """Build AsyncThreadsClient instances without a real httpx.AsyncClient.
+
+    For tests that only inspect client attributes and never send requests.
+    """
+    monkeypatch.setattr(httpx, "AsyncClient", create_autospec(httpx.AsyncClient))
+
+    def factory(**kwargs: Any) -> AsyncThreadsClient:
+        kwargs.setdefault("access_token", _TOKEN)
+        return AsyncThreadsClient(**kwargs)
+
+    return factory
+
+
+@pytest.fixture(scope="module")
+def module_router() -> Iterator[respx.MockRouter]:
+    """Install a single respx router for the whole test module."""
+    with respx.mock(assert_all_called=False) as router:
+        yield router
+
+
+@pytest.fixture
+def mock_router(module_router: respx.MockRouter) -> Iterator[respx.MockRouter]:
+    """Provide the module router, discarding routes added by the test."""
+    module_router.snapshot()
+    yield module_router
+    module_router.rollback()
@@ -1,48 +1,47 @@
 """Tests for asynchronous client."""
 
-from __future__ import annotations
+import asyncio
 
-import httpx
 import pytest
-import respx
 
+from tests.unit import patterns
+from tests.unit._fixtures import (
+    CONTAINER_FINISHED_BODY,
+    CONTAINER_IN_PROGRESS_BODY,
+    json_response,
+)
 from threads import AsyncThreadsClient
+from threads.exceptions import ContainerError
+
+_TOKEN = "test_token"
 
 
 class TestAsyncThreadsClient:
     """Tests for AsyncThreadsClient."""
 
-    async def test_client_initialization(self):
-        """Test client initializes correctly."""
-        client = AsyncThreadsClient(access_token="test_token")
-
-        assert client._access_token == "test_token"
-        assert client.http is not None
-        assert client.auth is not None
-        assert client.posts is not None
-        assert client.media is not None
-        assert client.insights is not None
-        assert client.replies is not None
-        assert client.webhooks is not None
-        await client.aclose()
-
-    async def test_client_context_manager(self):
-        """Test async context manager."""
-        async with AsyncThreadsClient(access_token="test_token") as client:
+    async def test_client_lifecycle(self):
+        """Test init, context manager exit, and use after close."""
+        async with AsyncThreadsClient(access_token=_TOKEN) as client:
+            assert client._access_token == _TOKEN
             assert client.http is not None
 
-    async def test_client_close(self):
-        """Test client close."""
-        client = AsyncThreadsClient(access_token="test_token")
-        await client.aclose()
-
         with pytest.raises(RuntimeError, match="Client has been closed"):
             _ = client.http
 
-    async def test_client_custom_config(self):
+        # Closing twice is a no-op
+        await client.aclose()
+
+    @pytest.mark.parametrize(
+        "attr",
+        ["http", "auth", "posts", "media", "insights", "replies", "users", "webhooks"],
+    )
+    async def test_sub_client_available(self, fresh_async_client, attr):
+        """Test each sub-client is created."""
+        assert getattr(fresh_async_client, attr) is not None
+
+    async def test_client_custom_config(self, stub_async_client):
         """Test client with custom configuration."""
-        client = AsyncThreadsClient(
-            access_token="test_token",
+        client = stub_async_client(
             base_url="https://custom.api.com",
             timeout=60.0,
             max_retries=5,
@@ -57,267 +56,156 @@ class TestAsyncThreadsClient:
 class TestAsyncAuthClient:
     """Tests for AsyncAuthClient."""
 
-    @respx.mock
-    async def test_exchange_code(self):
+    async def test_exchange_code(self, transport_client):
         """Test async code exchange."""
-        respx.post("https://graph.threads.net/oauth/access_token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "short_lived_token",
-                    "user_id": 12345,
-                },
-            )
+        result = await transport_client.auth.exchange_code(
+            client_id="app_123",
+            client_secret="secret_456",
+            redirect_uri="https://example.com/callback",
+            code="auth_code",
         )
 
-        async with AsyncThreadsClient(access_token="temp") as client:
-            result = await client.auth.exchange_code(
-                client_id="app_123",
-                client_secret="secret_456",
-                redirect_uri="https://example.com/callback",
-                code="auth_code",
-            )
-
-            assert result.access_token == "short_lived_token"
-            assert result.user_id == "12345"
+        assert result.access_token == "short_lived_token"
+        assert result.user_id == "12345"
 
-    @respx.mock
-    async def test_get_long_lived_token(self):
+    async def test_get_long_lived_token(self, transport_client):
         """Test async long-lived token exchange."""
-        respx.get(url__startswith="https://graph.threads.net/v1.0/access_token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "long_lived_token",
-                    "token_type": "bearer",
-                    "expires_in": 5184000,
-                },
-            )
+        result = await transport_client.auth.get_long_lived_token(
+            client_secret="secret",
+            short_lived_token="short_token",
         )
 
-        async with AsyncThreadsClient(access_token="temp") as client:
-            result = await client.auth.get_long_lived_token(
-                client_secret="secret",
-                short_lived_token="short_token",
-            )
-
-            assert result.access_token == "long_lived_token"
-            assert result.expires_in == 5184000
+        assert result.access_token == "long_lived_token"
+        assert result.expires_in == 5184000
 
-    @respx.mock
-    async def test_refresh_token(self):
+    async def test_refresh_token(self, transport_client):
         """Test async token refresh."""
-        respx.get(
-            url__startswith="https://graph.threads.net/v1.0/refresh_access_token"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "refreshed_token",
-                    "token_type": "bearer",
-                    "expires_in": 5184000,
-                },
-            )
-        )
-
-        async with AsyncThreadsClient(access_token="temp") as client:
-            result = await client.auth.refresh_token(access_token="old_token")
+        result = await transport_client.auth.refresh_token(access_token="old_token")
 
-            assert result.access_token == "refreshed_token"
+        assert result.access_token == "refreshed_token"
 
 
 class TestAsyncPostsClient:
     """Tests for AsyncPostsClient."""
 
-    @respx.mock
-    async def test_get_post(self):
+    async def test_get_post(self, transport_client):
         """Test async get post."""
-        respx.get(url__startswith="https://graph.threads.net/v1.0/post_123").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "id": "post_123",
-                    "text": "Test post",
-                    "media_type": "TEXT",
-                    "timestamp": "2024-01-15T10:30:00+0000",
-                },
-            )
-        )
-
-        async with AsyncThreadsClient(access_token="token") as client:
-            result = await client.posts.get("post_123")
+        result = await transport_client.posts.get("post_123")
 
-            assert result.id == "post_123"
-            assert result.text == "Test post"
+        assert result.id == "post_123"
+        assert result.text == "Test post"
 
-    @respx.mock
-    async def test_get_user_posts(self):
+    async def test_get_user_posts(self, transport_client):
         """Test async get user posts."""
-        respx.get(
-            url__startswith="https://graph.threads.net/v1.0/user_123/threads"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [
-                        {
-                            "id": "post_1",
-                            "text": "Post 1",
-                            "media_type": "TEXT",
-                            "timestamp": "2024-01-15T10:30:00+0000",
-                        },
-                        {
-                            "id": "post_2",
-                            "text": "Post 2",
-                            "media_type": "TEXT",
-                            "timestamp": "2024-01-14T10:30:00+0000",
-                        },
-                    ]
-                },
-            )
+        result = await transport_client.posts.get_user_posts("user_123")
+
+        assert len(result) == 2
+
+    async def test_wait_for_container_polls_until_ready(
+        self, fresh_async_client, mock_router
+    ):
+        """Test polling a container that finishes after a retry."""
+        route = mock_router.get(url__regex=patterns.CONTAINER_123).mock(
+            side_effect=[
+                json_response(CONTAINER_IN_PROGRESS_BODY),
+                json_response(CONTAINER_FINISHED_BODY),
+            ]
         )
 
-        async with AsyncThreadsClient(access_token="token") as client:
-            result = await client.posts.get_user_posts("user_123")
+        # fast_sleep keeps the long poll interval from delaying the test
+        result = await fresh_async_client.posts._wait_for_container(
+            "container_123", poll_interval=30.0
+        )
 
-            assert len(result) == 2
+        assert result.is_ready is True
+        assert route.call_count == 2
+
+    async def test_wait_for_container_timeout(self, fresh_async_client, mock_router):
+        """Test polling gives up once the backoff delays reach max_wait_time."""
+        mock_router.get(url__regex=patterns.CONTAINER_123).mock(
+            return_value=json_response(CONTAINER_IN_PROGRESS_BODY)
+        )
+
+        with pytest.raises(ContainerError, match=r"not ready after 5\.0s"):
+            await fresh_async_client.posts._wait_for_container(
+                "container_123", poll_interval=1.0, max_wait_time=5.0
+            )
 
 
 class TestAsyncMediaClient:
     """Tests for AsyncMediaClient."""
 
-    @respx.mock
-    async def test_create_container(self):
+    async def test_create_container(self, transport_client):
         """Test async create container."""
-        respx.post(
-            url__startswith="https://graph.threads.net/v1.0/user_123/threads"
-        ).mock(return_value=httpx.Response(200, json={"id": "container_123"}))
-
-        async with AsyncThreadsClient(access_token="token") as client:
-            from threads.constants import MediaType
+        from threads.constants import MediaType
 
-            result = await client.media.create_container(
-                user_id="user_123",
-                media_type=MediaType.TEXT,
-                text="Hello",
-            )
+        result = await transport_client.media.create_container(
+            user_id="user_123",
+            media_type=MediaType.TEXT,
+            text="Hello",
+        )
 
-            assert result.id == "container_123"
+        assert result.id == "container_123"
 
-    @respx.mock
-    async def test_get_container_status(self):
+    async def test_get_container_status(self, transport_client):
         """Test async get container status."""
-        respx.get(url__startswith="https://graph.threads.net/v1.0/container_123").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "id": "container_123",
-                    "status": "FINISHED",
-                },
-            )
-        )
+        result = await transport_client.media.get_container_status("container_123")
 
-        async with AsyncThreadsClient(access_token="token") as client:
-            result = await client.media.get_container_status("container_123")
-
-            assert result.is_ready is True
+        assert result.is_ready is True
 
 
 class TestAsyncInsightsClient:
     """Tests for AsyncInsightsClient."""
 
-    @respx.mock
-    async def test_get_media_insights(self):
+    async def test_get_media_insights(self, transport_client):
         """Test async get media insights."""
-        respx.get(
-            url__startswith="https://graph.threads.net/v1.0/post_123/insights"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [
-                        {"name": "views", "values": [{"value": 1000}]},
-                        {"name": "likes", "values": [{"value": 50}]},
-                    ]
-                },
-            )
-        )
+        result = await transport_client.insights.get_media_insights("post_123")
+
+        assert result.views == 1000
+        assert result.likes == 50
 
-        async with AsyncThreadsClient(access_token="token") as client:
-            result = await client.insights.get_media_insights("post_123")
+    async def test_get_views_and_engagement(self, transport_client):
+        """Test independent insight calls awaited concurrently."""
+        views, engagement = await asyncio.gather(
+            transport_client.insights.get_views("post_123"),
+            transport_client.insights.get_engagement("post_123"),
+        )
 
-            assert result.views == 1000
-            assert result.likes == 50
+        assert views == 1000
+        assert engagement == {"likes": 50, "replies": 0, "reposts": 0, "quotes": 0}
 
 
 class TestAsyncRepliesClient:
     """Tests for AsyncRepliesClient."""
 
-    @respx.mock
-    async def test_get_replies(self):
+    async def test_get_replies(self, transport_client):
         """Test async get replies."""
-        respx.get(
-            url__startswith="https://graph.threads.net/v1.0/post_123/replies"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [
-                        {
-                            "id": "reply_1",
-                            "text": "Reply 1",
-                            "timestamp": "2024-01-15T11:00:00+0000",
-                        },
-                    ]
-                },
-            )
-        )
+        result = await transport_client.replies.get_replies("post_123")
 
-        async with AsyncThreadsClient(access_token="token") as client:
-            result = await client.replies.get_replies("post_123")
+        assert len(result) == 1
+        assert result[0].text == "Reply 1"
 
-            assert len(result) == 1
-            assert result[0].text == "Reply 1"
-
-    @respx.mock
-    async def test_hide_reply(self):
+    async def test_hide_reply(self, transport_client):
         """Test async hide reply."""
-        respx.post(
-            url__startswith="https://graph.threads.net/v1.0/reply_123/manage_reply"
-        ).mock(return_value=httpx.Response(200, json={"success": True}))
-
-        async with AsyncThreadsClient(access_token="token") as client:
-            result = await client.replies.hide("reply_123")
+        result = await transport_client.replies.hide("reply_123")
 
-            assert result is True
+        assert result is True
 
 
 class TestAsyncWebhooksClient:
     """Tests for AsyncWebhooksClient."""
 
-    @respx.mock
-    async def test_subscribe(self):
+    async def test_subscribe(self, transport_client):
         """Test async webhook subscribe."""
-        respx.post(
-            url__startswith="https://graph.threads.net/v1.0/me/subscribed_apps"
-        ).mock(return_value=httpx.Response(200, json={"success": True}))
-
-        async with AsyncThreadsClient(access_token="token") as client:
-            result = await client.webhooks.subscribe(
-                callback_url="https://example.com/webhook",
-                verify_token="verify_token",
-            )
+        result = await transport_client.webhooks.subscribe(
+            callback_url="https://example.com/webhook",
+            verify_token="verify_token",
+        )
 
-            assert result.active is True
+        assert result.active is True
 
-    @respx.mock
-    async def test_unsubscribe(self):
+    async def test_unsubscribe(self, transport_client):
         """Test async webhook unsubscribe."""
-        respx.delete(
-            url__startswith="https://graph.threads.net/v1.0/me/subscribed_apps"
-        ).mock(return_value=httpx.Response(200, json={"success": True}))
-
-        async with AsyncThreadsClient(access_token="token") as client:
-            result = await client.webhooks.unsubscribe()
+        result = await transport_client.webhooks.unsubscribe()
 
-            assert result is True
+        assert result is True
@@ -0,0 +1,182 @@
+"""Pre-serialized API response bodies shared by the client tests.
+
+Bodies are encoded once at import so mocked responses reuse the same bytes
+instead of re-serializing a dict in every test.
+"""
+
+from typing import Any
+
+import httpx
+from pydantic_core import to_json
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Canned responses keyed by (method, URL path)
+Routes = dict[tuple[str, str], httpx.Response]
+
+
+def _encode(payload: dict[str, Any]) -> bytes:
+    """Serialize a JSON payload to compact bytes."""
+    return to_json(payload)
+
+
+def json_response(body: bytes, status_code: int = 200) -> httpx.Response:
+    """Build a JSON response from a pre-serialized body."""
+    return httpx.Response(status_code, content=body, headers=_JSON_HEADERS)
+
+
+def assert_fields(obj: object, **expected: Any) -> None:
+    """Assert several attributes of obj at once, reporting every mismatch."""
+    actual = {name: getattr(obj, name) for name in expected}
+    assert actual == expected
+
+
+def api_error(
+    message: str, code: int, error_type: str = "ThreadsAPIException"
+) -> bytes:
+    """Build a serialized Graph API error body."""
+    return _encode({"error": {"message": message, "type": error_type, "code": code}})
+
+
+SUCCESS_BODY = _encode({"success": True})
+FAILURE_BODY = _encode({"success": False})
+EMPTY_DATA_BODY = _encode({"data": []})
+
+# Auth
+SHORT_LIVED_TOKEN_BODY = _encode(
+    {
+        "access_token": "short_lived_token",
+        "user_id": 12345,
+    }
+)
+LONG_LIVED_TOKEN_BODY = _encode(
+    {
+        "access_token": "long_lived_token",
+        "token_type": "bearer",
+        "expires_in": 5184000,
+    }
+)
+REFRESHED_TOKEN_BODY = _encode(
+    {
+        "access_token": "refreshed_token",
+        "token_type": "bearer",
+        "expires_in": 5184000,
+    }
+)
+
+# Posts
+POST_TEMPLATE: dict[str, Any] = {
+    "media_type": "TEXT",
+    "timestamp": "2024-01-15T10:30:00+0000",
+}
+
+
+def make_post(post_id: str, text: str, **overrides: Any) -> dict[str, Any]:
+    """Build a post payload from POST_TEMPLATE."""
+    return {**POST_TEMPLATE, "id": post_id, "text": text, **overrides}
+
+
+POST_123_BODY = _encode(make_post("post_123", "Test post"))
+USER_POSTS_BODY = _encode(
+    {
+        "data": [
+            make_post("post_1", "Post 1"),
+            make_post("post_2", "Post 2", timestamp="2024-01-14T10:30:00+0000"),
+        ]
+    }
+)
+
+# Media
+CONTAINER_BODY = _encode({"id": "container_123"})
+PUBLISHED_POST_ID_BODY = _encode({"id": "post_456"})
+CONTAINER_FINISHED_BODY = _encode(
+    {
+        "id": "container_123",
+        "status": "FINISHED",
+    }
+)
+CONTAINER_IN_PROGRESS_BODY = _encode(
+    {
+        "id": "container_123",
+        "status": "IN_PROGRESS",
+    }
+)
+
+# Insights
+MEDIA_INSIGHTS_BODY = _encode(
+    {
+        "data": [
+            {"name": "views", "values": [{"value": 1000}]},
+            {"name": "likes", "values": [{"value": 50}]},
+        ]
+    }
+)
+
+# Replies
+REPLIES_BODY = _encode(
+    {
+        "data": [
+            {
+                "id": "reply_1",
+                "text": "Reply 1",
+                "timestamp": "2024-01-15T11:00:00+0000",
+            },
+        ]
+    }
+)
+
+# Users
+ME_BODY = _encode(
+    {
+        "id": "12345678",
+        "username": "testuser",
+        "name": "Test User",
+        "threads_profile_picture_url": "https://example.com/pic.jpg",
+        "threads_biography": "Hello, I'm a test user",
+    }
+)
+ME_CUSTOM_FIELDS_BODY = _encode(
+    {
+        "id": "12345678",
+        "username": "testuser",
+        "follower_count": 1000,
+        "following_count": 500,
+    }
+)
+USER_123_BODY = _encode(
+    {
+        "id": "user_123",
+        "username": "otheruser",
+        "name": "Other User",
+        "threads_profile_picture_url": "https://example.com/other.jpg",
+        "threads_biography": "Another user profile",
+    }
+)
+USER_456_BODY = _encode(
+    {
+        "id": "user_456",
+        "username": "customuser",
+        "is_eligible_for_geo_gating": True,
+        "hide_status": "visible",
+    }
+)
+
+# Errors
+INVALID_TOKEN_ERROR_BODY = _encode(
+    {
+        "error": {
+            "message": "Invalid access token",
+            "type": "OAuthException",
+            "code": 190,
+        }
+    }
+)
+USER_NOT_FOUND_ERROR_BODY = _encode(
+    {
+        "error": {
+            "message": "User not found",
+            "type": "OAuthException",
+            "code": 100,
+        }
+    }
+)
@@ -0,0 +1,55 @@
+"""Shared fixtures for synchronous client tests.
+
+The suite runs under pytest-xdist with --dist=loadfile, so each worker
+process gets its own session-scoped transport_client and route registry, and a
+module's tests always run on the same worker.
+"""
+
+import time
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from tests.unit._fixtures import Routes
+from threads import ThreadsClient
+
+_TOKEN = "test_token"
+
+# Filled per test through the routes fixture and served by transport_client
+_ROUTES: Routes = {}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Answer a request from the routes registered by the current test."""
+    try:
+        return _ROUTES[(request.method, request.url.path)]
+    except KeyError:
+        raise AssertionError(
+            f"No route registered for {request.method} {request.url.path}"
+        ) from None
+
+
+@pytest.fixture(autouse=True)
+def fast_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make time.sleep return immediately so polling never waits in tests."""
+    monkeypatch.setattr(time, "sleep", lambda _seconds: None)
+
+
+@pytest.fixture(scope="session")
+def transport_client() -> Iterator[ThreadsClient]:
+    """Provide a session ThreadsClient served by an httpx.MockTransport.
+
+    Responses come from the routes fixture, so tests using this client need
+    no respx router.
+    """
+    transport = httpx.MockTransport(_handler)
+    with ThreadsClient(access_token=_TOKEN, transport=transport) as client:
+        yield client
+
+
+@pytest.fixture
+def routes() -> Iterator[Routes]:
+    """Register canned responses for transport_client, cleared after the test."""
+    yield _ROUTES
+    _ROUTES.clear()
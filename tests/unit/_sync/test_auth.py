@@ -2,161 +2,147 @@
 
 from __future__ import annotations
 
-import httpx
+from typing import TYPE_CHECKING
+
 import pytest
-import respx
+from pydantic_core import to_json
 
+from tests.unit import patterns
+from tests.unit._fixtures import api_error, assert_fields, json_response
 from threads import ThreadsClient
 from threads.exceptions import AuthenticationError
 
+if TYPE_CHECKING:
+    import respx
+
+_SHORT_LIVED_TOKEN_BODY = to_json(
+    {
+        "access_token": "short_lived_token_123",
+        "user_id": 12345678,
+    }
+)
+_INVALID_CODE_BODY = api_error("Invalid authorization code", 190, "OAuthException")
+_LONG_LIVED_TOKEN_BODY = to_json(
+    {
+        "access_token": "long_lived_token_abc",
+        "token_type": "bearer",
+        "expires_in": 5184000,
+    }
+)
+_INVALID_SHORT_TOKEN_BODY = api_error(
+    "Invalid short-lived token", 190, "OAuthException"
+)
+_REFRESHED_TOKEN_BODY = to_json(
+    {
+        "access_token": "refreshed_token_xyz",
+        "token_type": "bearer",
+        "expires_in": 5184000,
+    }
+)
+_TOKEN_EXPIRED_BODY = api_error("Token expired", 190, "OAuthException")
+
 
 class TestAuthClient:
     """Tests for AuthClient."""
 
-    @respx.mock
-    def test_exchange_code_success(self):
+    @pytest.mark.respx(assert_all_called=False)
+    def test_exchange_code_success(
+        self, fresh_sync_client: ThreadsClient, respx_mock: respx.MockRouter
+    ):
         """Test successful code exchange."""
-        respx.post("https://graph.threads.net/oauth/access_token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "short_lived_token_123",
-                    "user_id": 12345678,
-                },
-            )
+        respx_mock.post(url__regex=patterns.OAUTH_ACCESS_TOKEN).mock(
+            return_value=json_response(_SHORT_LIVED_TOKEN_BODY)
         )
 
-        client = ThreadsClient(access_token="temp")
-        result = client.auth.exchange_code(
+        result = fresh_sync_client.auth.exchange_code(
             client_id="app_123",
             client_secret="secret_456",
             redirect_uri="https://example.com/callback",
             code="auth_code_789",
         )
 
-        assert result.access_token == "short_lived_token_123"
-        assert result.user_id == "12345678"
-        client.close()
+        assert_fields(result, access_token="short_lived_token_123", user_id="12345678")
 
-    @respx.mock
-    def test_exchange_code_error(self):
+    @pytest.mark.respx(assert_all_called=False)
+    def test_exchange_code_error(
+        self, fresh_sync_client: ThreadsClient, respx_mock: respx.MockRouter
+    ):
         """Test code exchange with error response."""
-        respx.post("https://graph.threads.net/oauth/access_token").mock(
-            return_value=httpx.Response(
-                401,
-                json={
-                    "error": {
-                        "message": "Invalid authorization code",
-                        "type": "OAuthException",
-                        "code": 190,
-                    }
-                },
-            )
+        respx_mock.post(url__regex=patterns.OAUTH_ACCESS_TOKEN).mock(
+            return_value=json_response(_INVALID_CODE_BODY, 401)
         )
 
-        client = ThreadsClient(access_token="temp")
         with pytest.raises(AuthenticationError):
-            client.auth.exchange_code(
+            fresh_sync_client.auth.exchange_code(
                 client_id="app_123",
                 client_secret="secret_456",
                 redirect_uri="https://example.com/callback",
                 code="invalid_code",
             )
-        client.close()
 
-    @respx.mock
-    def test_get_long_lived_token_success(self):
+    @pytest.mark.respx(assert_all_called=False)
+    def test_get_long_lived_token_success(
+        self, fresh_sync_client: ThreadsClient, respx_mock: respx.MockRouter
+    ):
         """Test successful long-lived token exchange."""
-        respx.get(url__startswith="https://graph.threads.net/v1.0/access_token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "long_lived_token_abc",
-                    "token_type": "bearer",
-                    "expires_in": 5184000,
-                },
-            )
+        respx_mock.get(url__regex=patterns.ACCESS_TOKEN).mock(
+            return_value=json_response(_LONG_LIVED_TOKEN_BODY)
         )
 
-        client = ThreadsClient(access_token="temp")
-        result = client.auth.get_long_lived_token(
+        result = fresh_sync_client.auth.get_long_lived_token(
             client_secret="secret_456",
             short_lived_token="short_token",
         )
 
-        assert result.access_token == "long_lived_token_abc"
-        assert result.token_type == "bearer"
-        assert result.expires_in == 5184000
-        assert result.expires_in_days == 60
-        client.close()
+        assert_fields(
+            result,
+            access_token="long_lived_token_abc",
+            token_type="bearer",
+            expires_in=5184000,
+            expires_in_days=60,
+        )
 
-    @respx.mock
-    def test_get_long_lived_token_error(self):
+    @pytest.mark.respx(assert_all_called=False)
+    def test_get_long_lived_token_error(
+        self, fresh_sync_client: ThreadsClient, respx_mock: respx.MockRouter
+    ):
         """Test long-lived token exchange with error."""
-        respx.get(url__startswith="https://graph.threads.net/v1.0/access_token").mock(
-            return_value=httpx.Response(
-                400,
-                json={
-                    "error": {
-                        "message": "Invalid short-lived token",
-                        "type": "OAuthException",
-                        "code": 190,
-                    }
-                },
-            )
+        respx_mock.get(url__regex=patterns.ACCESS_TOKEN).mock(
+            return_value=json_response(_INVALID_SHORT_TOKEN_BODY, 400)
         )
 
-        client = ThreadsClient(access_token="temp")
         with pytest.raises(AuthenticationError):
-            client.auth.get_long_lived_token(
+            fresh_sync_client.auth.get_long_lived_token(
                 client_secret="secret_456",
                 short_lived_token="invalid_token",
             )
-        client.close()
 
-    @respx.mock
-    def test_refresh_token_success(self):
+    @pytest.mark.respx(assert_all_called=False)
+    def test_refresh_token_success(
+        self, fresh_sync_client: ThreadsClient, respx_mock: respx.MockRouter
+    ):
         """Test successful token refresh."""
-        respx.get(
-            url__startswith="https://graph.threads.net/v1.0/refresh_access_token"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "refreshed_token_xyz",
-                    "token_type": "bearer",
-                    "expires_in": 5184000,
-                },
-            )
+        respx_mock.get(url__regex=patterns.REFRESH_ACCESS_TOKEN).mock(
+            return_value=json_response(_REFRESHED_TOKEN_BODY)
         )
 
-        client = ThreadsClient(access_token="temp")
-        result = client.auth.refresh_token(access_token="old_token")
+        result = fresh_sync_client.auth.refresh_token(access_token="old_token")
 
-        assert result.access_token == "refreshed_token_xyz"
-        assert result.token_type == "bearer"
-        assert result.expires_in == 5184000
-        client.close()
+        assert_fields(
+            result,
+            access_token="refreshed_token_xyz",
+            token_type="bearer",
+            expires_in=5184000,
+        )
 
-    @respx.mock
-    def test_refresh_token_error(self):
+    @pytest.mark.respx(assert_all_called=False)
+    def test_refresh_token_error(
+        self, fresh_sync_client: ThreadsClient, respx_mock: respx.MockRouter
+    ):
         """Test token refresh with error."""
-        respx.get(
-            url__startswith="https://graph.threads.net/v1.0/refresh_access_token"
-        ).mock(
-            return_value=httpx.Response(
-                400,
-                json={
-                    "error": {
-                        "message": "Token expired",
-                        "type": "OAuthException",
-                        "code": 190,
-                    }
-                },
-            )
+        respx_mock.get(url__regex=patterns.REFRESH_ACCESS_TOKEN).mock(
+            return_value=json_response(_TOKEN_EXPIRED_BODY, 400)
         )
 
-        client = ThreadsClient(access_token="temp")
         with pytest.raises(AuthenticationError):
-            client.auth.refresh_token(access_token="expired_token")
-        client.close()
+            fresh_sync_client.auth.refresh_token(access_token="expired_token")
@@ -2,206 +2,179 @@
 
 from __future__ import annotations
 
-import httpx
-import pytest
-import respx
+from typing import TYPE_CHECKING
 
+import pytest
+from pydantic_core import to_json
+
+from tests.unit import patterns
+from tests.unit._fixtures import (
+    Routes,
+    api_error,
+    json_response,
+)
 from threads import ThreadsClient
 from threads.constants import MetricType
 from threads.exceptions import ThreadsAPIError
 
+if TYPE_CHECKING:
+    import respx
+
+_MEDIA_INSIGHTS_BODY = to_json(
+    {
+        "data": [
+            {"name": "views", "values": [{"value": 1500}]},
+            {"name": "likes", "values": [{"value": 100}]},
+            {"name": "replies", "values": [{"value": 25}]},
+            {"name": "reposts", "values": [{"value": 10}]},
+            {"name": "quotes", "values": [{"value": 5}]},
+        ]
+    }
+)
+_VIEWS_AND_LIKES_BODY = to_json(
+    {
+        "data": [
+            {"name": "views", "values": [{"value": 1500}]},
+            {"name": "likes", "values": [{"value": 100}]},
+        ]
+    }
+)
+_POST_NOT_FOUND_BODY = api_error("Post not found", 100)
+_USER_INSIGHTS_BODY = to_json(
+    {
+        "data": [
+            {
+                "name": "views",
+                "period": "lifetime",
+                "values": [{"value": 50000}],
+                "total_value": {"value": 50000},
+            },
+            {
+                "name": "followers_count",
+                "period": "lifetime",
+                "values": [{"value": 1000}],
+                "total_value": {"value": 1000},
+            },
+        ]
+    }
+)
+_DAILY_VIEWS_BODY = to_json(
+    {
+        "data": [
+            {
+                "name": "views",
+                "period": "day",
+                "values": [{"value": 10000}],
+                "total_value": {"value": 10000},
+            },
+        ]
+    }
+)
+_VIEWS_BODY = to_json(
+    {
+        "data": [
+            {"name": "views", "values": [{"value": 2500}]},
+        ]
+    }
+)
+_ENGAGEMENT_BODY = to_json(
+    {
+        "data": [
+            {"name": "likes", "values": [{"value": 150}]},
+            {"name": "replies", "values": [{"value": 30}]},
+            {"name": "reposts", "values": [{"value": 15}]},
+            {"name": "quotes", "values": [{"value": 8}]},
+        ]
+    }
+)
+
 
 class TestInsightsClient:
     """Tests for InsightsClient."""
 
-    @respx.mock
-    def test_get_media_insights(self):
+    def test_get_media_insights(self, transport_client: ThreadsClient, routes: Routes):
         """Test getting media insights."""
-        respx.get(
-            url__startswith="https://graph.threads.net/v1.0/post_123/insights"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [
-                        {"name": "views", "values": [{"value": 1500}]},
-                        {"name": "likes", "values": [{"value": 100}]},
-                        {"name": "replies", "values": [{"value": 25}]},
-                        {"name": "reposts", "values": [{"value": 10}]},
-                        {"name": "quotes", "values": [{"value": 5}]},
-                    ]
-                },
-            )
-        )
+        routes["GET", "/v1.0/post_123/insights"] = json_response(_MEDIA_INSIGHTS_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.insights.get_media_insights("post_123")
+        result = transport_client.insights.get_media_insights("post_123")
 
         assert result.views == 1500
         assert result.likes == 100
         assert result.replies == 25
         assert result.reposts == 10
         assert result.quotes == 5
-        client.close()
 
-    @respx.mock
-    def test_get_media_insights_with_specific_metrics(self):
+    @pytest.mark.respx(assert_all_called=False)
+    def test_get_media_insights_with_specific_metrics(
+        self, fresh_sync_client: ThreadsClient, respx_mock: respx.MockRouter
+    ):
         """Test getting specific media insights."""
-        respx.get(
-            url__startswith="https://graph.threads.net/v1.0/post_123/insights"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [
-                        {"name": "views", "values": [{"value": 1500}]},
-                        {"name": "likes", "values": [{"value": 100}]},
-                    ]
-                },
-            )
-        )
+        respx_mock.get(
+            url__regex=patterns.POST_123_INSIGHTS,
+            params__contains={"metric": "views,likes"},
+        ).mock(return_value=json_response(_VIEWS_AND_LIKES_BODY))
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.insights.get_media_insights(
+        result = fresh_sync_client.insights.get_media_insights(
             "post_123",
             metrics=[MetricType.VIEWS, MetricType.LIKES],
         )
 
         assert result.views == 1500
         assert result.likes == 100
-        client.close()
 
-    @respx.mock
-    def test_get_media_insights_error(self):
+    def test_get_media_insights_error(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test getting media insights with error."""
-        respx.get(
-            url__startswith="https://graph.threads.net/v1.0/post_123/insights"
-        ).mock(
-            return_value=httpx.Response(
-                404,
-                json={
-                    "error": {
-                        "message": "Post not found",
-                        "type": "ThreadsAPIException",
-                        "code": 100,
-                    }
-                },
-            )
+        routes["GET", "/v1.0/post_123/insights"] = json_response(
+            _POST_NOT_FOUND_BODY, 404
         )
 
-        client = ThreadsClient(access_token="token_123")
         with pytest.raises(ThreadsAPIError):
-            client.insights.get_media_insights("post_123")
-        client.close()
+            transport_client.insights.get_media_insights("post_123")
 
-    @respx.mock
-    def test_get_user_insights(self):
+    def test_get_user_insights(self, transport_client: ThreadsClient, routes: Routes):
         """Test getting user insights."""
-        respx.get(
-            url__startswith="https://graph.threads.net/v1.0/user_123/threads_insights"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [
-                        {
-                            "name": "views",
-                            "period": "lifetime",
-                            "values": [{"value": 50000}],
-                            "total_value": {"value": 50000},
-                        },
-                        {
-                            "name": "followers_count",
-                            "period": "lifetime",
-                            "values": [{"value": 1000}],
-                            "total_value": {"value": 1000},
-                        },
-                    ]
-                },
-            )
+        routes["GET", "/v1.0/user_123/threads_insights"] = json_response(
+            _USER_INSIGHTS_BODY
         )
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.insights.get_user_insights("user_123")
+        result = transport_client.insights.get_user_insights("user_123")
 
         assert result.get_metric("views") == 50000
         assert result.get_metric("followers_count") == 1000
-        client.close()
 
-    @respx.mock
-    def test_get_user_insights_with_time_range(self):
+    @pytest.mark.respx(assert_all_called=False)
+    def test_get_user_insights_with_time_range(
+        self, fresh_sync_client: ThreadsClient, respx_mock: respx.MockRouter
+    ):
         """Test getting user insights with time range."""
-        respx.get(
-            url__startswith="https://graph.threads.net/v1.0/user_123/threads_insights"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [
-                        {
-                            "name": "views",
-                            "period": "day",
-                            "values": [{"value": 10000}],
-                            "total_value": {"value": 10000},
-                        },
-                    ]
-                },
-            )
-        )
+        respx_mock.get(
+            url__regex=patterns.USER_123_THREADS_INSIGHTS,
+            params__contains={"since": "1704067200", "until": "1706745600"},
+        ).mock(return_value=json_response(_DAILY_VIEWS_BODY))
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.insights.get_user_insights(
+        result = fresh_sync_client.insights.get_user_insights(
             "user_123",
             since=1704067200,
             until=1706745600,
         )
 
         assert result.get_metric("views") == 10000
-        client.close()
 
-    @respx.mock
-    def test_get_views(self):
+    def test_get_views(self, transport_client: ThreadsClient, routes: Routes):
         """Test getting view count convenience method."""
-        respx.get(
-            url__startswith="https://graph.threads.net/v1.0/post_123/insights"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [
-                        {"name": "views", "values": [{"value": 2500}]},
-                    ]
-                },
-            )
-        )
+        routes["GET", "/v1.0/post_123/insights"] = json_response(_VIEWS_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.insights.get_views("post_123")
+        result = transport_client.insights.get_views("post_123")
 
         assert result == 2500
-        client.close()
 
-    @respx.mock
-    def test_get_engagement(self):
+    def test_get_engagement(self, transport_client: ThreadsClient, routes: Routes):
         """Test getting engagement metrics."""
-        respx.get(
-            url__startswith="https://graph.threads.net/v1.0/post_123/insights"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [
-                        {"name": "likes", "values": [{"value": 150}]},
-                        {"name": "replies", "values": [{"value": 30}]},
-                        {"name": "reposts", "values": [{"value": 15}]},
-                        {"name": "quotes", "values": [{"value": 8}]},
-                    ]
-                },
-            )
-        )
+        routes["GET", "/v1.0/post_123/insights"] = json_response(_ENGAGEMENT_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.insights.get_engagement("post_123")
+        result = transport_client.insights.get_engagement("post_123")
 
         assert result == {
             "likes": 150,
@@ -209,4 +182,3 @@ class TestInsightsClient:
             "reposts": 15,
             "quotes": 8,
         }
-        client.close()
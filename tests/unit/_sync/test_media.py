@@ -2,112 +2,118 @@
 
 from __future__ import annotations
 
-import httpx
 import pytest
-import respx
-
+from pydantic_core import to_json
+
+from tests.unit._fixtures import (
+    CONTAINER_BODY,
+    CONTAINER_FINISHED_BODY,
+    CONTAINER_IN_PROGRESS_BODY,
+    Routes,
+    api_error,
+    json_response,
+)
 from threads import ThreadsClient
 from threads.constants import ContainerStatus, MediaType, ReplyControl
 from threads.exceptions import ThreadsAPIError
 
+_IMAGE_CONTAINER_BODY = to_json({"id": "container_456"})
+_VIDEO_CONTAINER_BODY = to_json({"id": "container_789"})
+_CAROUSEL_CONTAINER_BODY = to_json({"id": "carousel_123"})
+_CAROUSEL_ITEM_BODY = to_json({"id": "item_123"})
+_REPLY_CONTAINER_BODY = to_json({"id": "reply_container_123"})
+_INVALID_MEDIA_URL_BODY = api_error("Invalid media URL", 100)
+_PROCESSING_FAILED_BODY = to_json(
+    {
+        "id": "container_123",
+        "status": "ERROR",
+        "error_message": "Video processing failed",
+    }
+)
+
 
 class TestMediaClient:
     """Tests for MediaClient."""
 
-    @respx.mock
-    def test_create_text_container(self):
+    def test_create_text_container(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test creating a text container."""
-        respx.post("https://graph.threads.net/v1.0/user_123/threads").mock(
-            return_value=httpx.Response(200, json={"id": "container_123"})
-        )
+        routes["POST", "/v1.0/user_123/threads"] = json_response(CONTAINER_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.media.create_container(
+        result = transport_client.media.create_container(
             user_id="user_123",
             media_type=MediaType.TEXT,
             text="Hello World",
         )
 
         assert result.id == "container_123"
-        client.close()
 
-    @respx.mock
-    def test_create_image_container(self):
+    def test_create_image_container(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test creating an image container."""
-        respx.post("https://graph.threads.net/v1.0/user_123/threads").mock(
-            return_value=httpx.Response(200, json={"id": "container_456"})
-        )
+        routes["POST", "/v1.0/user_123/threads"] = json_response(_IMAGE_CONTAINER_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.media.create_image_container(
+        result = transport_client.media.create_image_container(
             user_id="user_123",
             image_url="https://example.com/image.jpg",
             text="Check out this image!",
         )
 
         assert result.id == "container_456"
-        client.close()
 
-    @respx.mock
-    def test_create_video_container(self):
+    def test_create_video_container(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test creating a video container."""
-        respx.post("https://graph.threads.net/v1.0/user_123/threads").mock(
-            return_value=httpx.Response(200, json={"id": "container_789"})
-        )
+        routes["POST", "/v1.0/user_123/threads"] = json_response(_VIDEO_CONTAINER_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.media.create_video_container(
+        result = transport_client.media.create_video_container(
             user_id="user_123",
             video_url="https://example.com/video.mp4",
             text="Check out this video!",
         )
 
         assert result.id == "container_789"
-        client.close()
 
-    @respx.mock
-    def test_create_carousel_container(self):
+    def test_create_carousel_container(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test creating a carousel container."""
-        respx.post("https://graph.threads.net/v1.0/user_123/threads").mock(
-            return_value=httpx.Response(200, json={"id": "carousel_123"})
+        routes["POST", "/v1.0/user_123/threads"] = json_response(
+            _CAROUSEL_CONTAINER_BODY
         )
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.media.create_carousel_container(
+        result = transport_client.media.create_carousel_container(
             user_id="user_123",
             children=["item_1", "item_2", "item_3"],
             text="My carousel post",
         )
 
         assert result.id == "carousel_123"
-        client.close()
 
-    @respx.mock
-    def test_create_carousel_item(self):
+    def test_create_carousel_item(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test creating a carousel item."""
-        respx.post("https://graph.threads.net/v1.0/user_123/threads").mock(
-            return_value=httpx.Response(200, json={"id": "item_123"})
-        )
+        routes["POST", "/v1.0/user_123/threads"] = json_response(_CAROUSEL_ITEM_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.media.create_image_container(
+        result = transport_client.media.create_image_container(
             user_id="user_123",
             image_url="https://example.com/image.jpg",
             is_carousel_item=True,
         )
 
         assert result.id == "item_123"
-        client.close()
 
-    @respx.mock
-    def test_create_container_with_reply_control(self):
+    def test_create_container_with_reply_control(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test creating container with reply control."""
-        respx.post("https://graph.threads.net/v1.0/user_123/threads").mock(
-            return_value=httpx.Response(200, json={"id": "container_123"})
-        )
+        routes["POST", "/v1.0/user_123/threads"] = json_response(CONTAINER_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.media.create_container(
+        result = transport_client.media.create_container(
             user_id="user_123",
             media_type=MediaType.TEXT,
             text="Mentioned only",
@@ -115,17 +121,14 @@ class TestMediaClient:
         )
 
         assert result.id == "container_123"
-        client.close()
 
-    @respx.mock
-    def test_create_container_as_reply(self):
+    def test_create_container_as_reply(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test creating container as a reply."""
-        respx.post("https://graph.threads.net/v1.0/user_123/threads").mock(
-            return_value=httpx.Response(200, json={"id": "reply_container_123"})
-        )
+        routes["POST", "/v1.0/user_123/threads"] = json_response(_REPLY_CONTAINER_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.media.create_container(
+        result = transport_client.media.create_container(
             user_id="user_123",
             media_type=MediaType.TEXT,
             text="This is a reply",
@@ -133,93 +136,60 @@ class TestMediaClient:
         )
 
         assert result.id == "reply_container_123"
-        client.close()
 
-    @respx.mock
-    def test_create_container_error(self):
+    def test_create_container_error(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test creating container with error."""
-        respx.post("https://graph.threads.net/v1.0/user_123/threads").mock(
-            return_value=httpx.Response(
-                400,
-                json={
-                    "error": {
-                        "message": "Invalid media URL",
-                        "type": "ThreadsAPIException",
-                        "code": 100,
-                    }
-                },
-            )
+        routes["POST", "/v1.0/user_123/threads"] = json_response(
+            _INVALID_MEDIA_URL_BODY, 400
         )
 
-        client = ThreadsClient(access_token="token_123")
         with pytest.raises(ThreadsAPIError):
-            client.media.create_container(
+            transport_client.media.create_container(
                 user_id="user_123",
                 media_type=MediaType.IMAGE,
                 image_url="https://invalid-url.com/image.jpg",
             )
-        client.close()
-
-    @respx.mock
-    def test_get_container_status_finished(self):
-        """Test getting container status when finished."""
-        respx.get("https://graph.threads.net/v1.0/container_123").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "id": "container_123",
-                    "status": "FINISHED",
-                },
-            )
-        )
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.media.get_container_status("container_123")
+    @pytest.mark.parametrize(
+        ("body", "status", "is_ready", "has_error", "error_message"),
+        [
+            (CONTAINER_FINISHED_BODY, ContainerStatus.FINISHED, True, False, None),
+            (
+                CONTAINER_IN_PROGRESS_BODY,
+                ContainerStatus.IN_PROGRESS,
+                False,
+                False,
+                None,
+            ),
+            (
+                _PROCESSING_FAILED_BODY,
+                ContainerStatus.ERROR,
+                False,
+                True,
+                "Video processing failed",
+            ),
+        ],
+        ids=["finished", "in_progress", "error"],
+    )
+    def test_get_container_status(
+        self,
+        transport_client: ThreadsClient,
+        routes: Routes,
+        body: bytes,
+        status: ContainerStatus,
+        is_ready: bool,
+        has_error: bool,
+        error_message: str | None,
+    ):
+        """Test getting container status for each processing state."""
+        routes["GET", "/v1.0/container_123"] = json_response(body)
+
+        result = transport_client.media.get_container_status("container_123")
 
         assert result.id == "container_123"
-        assert result.status == ContainerStatus.FINISHED
-        assert result.is_ready is True
-        assert result.has_error is False
-        client.close()
-
-    @respx.mock
-    def test_get_container_status_in_progress(self):
-        """Test getting container status when in progress."""
-        respx.get("https://graph.threads.net/v1.0/container_123").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "id": "container_123",
-                    "status": "IN_PROGRESS",
-                },
-            )
-        )
-
-        client = ThreadsClient(access_token="token_123")
-        result = client.media.get_container_status("container_123")
-
-        assert result.status == ContainerStatus.IN_PROGRESS
-        assert result.is_ready is False
-        client.close()
-
-    @respx.mock
-    def test_get_container_status_error(self):
-        """Test getting container status with error."""
-        respx.get("https://graph.threads.net/v1.0/container_123").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "id": "container_123",
-                    "status": "ERROR",
-                    "error_message": "Video processing failed",
-                },
-            )
-        )
-
-        client = ThreadsClient(access_token="token_123")
-        result = client.media.get_container_status("container_123")
-
-        assert result.status == ContainerStatus.ERROR
-        assert result.has_error is True
-        assert result.error_message == "Video processing failed"
-        client.close()
+        assert result.status == status
+        assert result.is_ready is is_ready
+        assert result.has_error is has_error
+        assert result.error_message == error_message
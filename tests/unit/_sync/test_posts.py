@@ -2,164 +2,167 @@
 
 from __future__ import annotations
 
-import httpx
-import pytest
-import respx
+import random
+import time
+from typing import TYPE_CHECKING
 
+import pytest
+from pydantic_core import to_json
+
+from tests.unit import patterns
+from tests.unit._fixtures import (
+    CONTAINER_BODY,
+    CONTAINER_FINISHED_BODY,
+    CONTAINER_IN_PROGRESS_BODY,
+    EMPTY_DATA_BODY,
+    PUBLISHED_POST_ID_BODY,
+    Routes,
+    api_error,
+    json_response,
+    make_post,
+)
 from threads import ThreadsClient
 from threads.constants import ReplyControl
 from threads.exceptions import ContainerError, ThreadsAPIError, ValidationError
 
+if TYPE_CHECKING:
+    import respx
+
+_HELLO_WORLD_POST_BODY = to_json(
+    make_post(
+        "post_456",
+        "Hello World",
+        permalink="https://threads.net/@user/post/abc123",
+    )
+)
+_CONTAINER_NOT_READY_BODY = api_error("Container not ready", 100)
+_POST_123_BODY = to_json(
+    make_post(
+        "post_123",
+        "Test post",
+        permalink="https://threads.net/@user/post/123",
+    )
+)
+_CUSTOM_FIELDS_POST_BODY = to_json(
+    {
+        "id": "post_123",
+        "text": "Custom fields test",
+        "media_type": "TEXT",
+    }
+)
+_USER_POSTS_BODY = to_json(
+    {
+        "data": [
+            make_post("post_1", "First post"),
+            make_post("post_2", "Second post", timestamp="2024-01-14T10:30:00+0000"),
+        ]
+    }
+)
+_FILTERED_POSTS_BODY = to_json(
+    {
+        "data": [
+            make_post("post_1", "Filtered post"),
+        ]
+    }
+)
+_PUBLISHING_LIMIT_BODY = to_json(
+    {
+        "data": [
+            {
+                "quota_usage": 50,
+                "config": {
+                    "quota_total": 250,
+                    "reply_quota_total": 1000,
+                },
+                "reply_quota_usage": 100,
+            }
+        ]
+    }
+)
+_SDK_POST_BODY = to_json(make_post("post_456", "Hello from SDK"))
+_FOLLOWERS_ONLY_POST_BODY = to_json(make_post("post_456", "Followers only"))
+_VIDEO_POST_BODY = to_json(make_post("post_456", "Video post", media_type="VIDEO"))
+_INVALID_VIDEO_BODY = to_json(
+    {
+        "id": "container_123",
+        "status": "ERROR",
+        "error_message": "Invalid video format",
+    }
+)
+_CONTAINER_EXPIRED_BODY = to_json(
+    {
+        "id": "container_123",
+        "status": "EXPIRED",
+    }
+)
+
 
 class TestPostsClient:
     """Tests for PostsClient."""
 
-    @respx.mock
-    def test_publish_success(self):
+    def test_publish_success(self, transport_client: ThreadsClient, routes: Routes):
         """Test successful post publish."""
-        respx.post(path__regex=r".*/user_123/threads_publish.*").mock(
-            return_value=httpx.Response(200, json={"id": "post_456"})
-        )
-        respx.get(path__regex=r".*/post_456.*").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "id": "post_456",
-                    "text": "Hello World",
-                    "media_type": "TEXT",
-                    "timestamp": "2024-01-15T10:30:00+0000",
-                    "permalink": "https://threads.net/@user/post/abc123",
-                },
-            )
+        routes["POST", "/v1.0/user_123/threads_publish"] = json_response(
+            PUBLISHED_POST_ID_BODY
         )
+        routes["GET", "/v1.0/post_456"] = json_response(_HELLO_WORLD_POST_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.posts.publish(user_id="user_123", container_id="container_789")
+        result = transport_client.posts.publish(
+            user_id="user_123", container_id="container_789"
+        )
 
         assert result.id == "post_456"
         assert result.text == "Hello World"
-        client.close()
 
-    @respx.mock
-    def test_publish_error(self):
+    def test_publish_error(self, transport_client: ThreadsClient, routes: Routes):
         """Test publish with error."""
-        respx.post(path__regex=r".*/user_123/threads_publish.*").mock(
-            return_value=httpx.Response(
-                400,
-                json={
-                    "error": {
-                        "message": "Container not ready",
-                        "type": "ThreadsAPIException",
-                        "code": 100,
-                    }
-                },
-            )
+        routes["POST", "/v1.0/user_123/threads_publish"] = json_response(
+            _CONTAINER_NOT_READY_BODY, 400
         )
 
-        client = ThreadsClient(access_token="token_123")
         with pytest.raises(ThreadsAPIError):
-            client.posts.publish(user_id="user_123", container_id="container_789")
-        client.close()
+            transport_client.posts.publish(
+                user_id="user_123", container_id="container_789"
+            )
 
-    @respx.mock
-    def test_get_post(self):
+    def test_get_post(self, transport_client: ThreadsClient, routes: Routes):
         """Test getting a post by ID."""
-        respx.get(path__regex=r".*/post_123.*").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "id": "post_123",
-                    "text": "Test post",
-                    "media_type": "TEXT",
-                    "timestamp": "2024-01-15T10:30:00+0000",
-                    "permalink": "https://threads.net/@user/post/123",
-                },
-            )
-        )
+        routes["GET", "/v1.0/post_123"] = json_response(_POST_123_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.posts.get("post_123")
+        result = transport_client.posts.get("post_123")
 
         assert result.id == "post_123"
         assert result.text == "Test post"
         assert result.media_type == "TEXT"
-        client.close()
 
-    @respx.mock
-    def test_get_post_with_custom_fields(self):
+    def test_get_post_with_custom_fields(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test getting a post with custom fields."""
-        respx.get(path__regex=r".*/post_123.*").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "id": "post_123",
-                    "text": "Custom fields test",
-                    "media_type": "TEXT",
-                },
-            )
-        )
+        routes["GET", "/v1.0/post_123"] = json_response(_CUSTOM_FIELDS_POST_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.posts.get("post_123", fields=["id", "text"])
+        result = transport_client.posts.get("post_123", fields=["id", "text"])
 
         assert result.id == "post_123"
         assert result.text == "Custom fields test"
-        client.close()
 
-    @respx.mock
-    def test_get_user_posts(self):
+    def test_get_user_posts(self, transport_client: ThreadsClient, routes: Routes):
         """Test getting user posts."""
-        respx.get(path__regex=r".*/user_123/threads$").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [
-                        {
-                            "id": "post_1",
-                            "text": "First post",
-                            "media_type": "TEXT",
-                            "timestamp": "2024-01-15T10:30:00+0000",
-                        },
-                        {
-                            "id": "post_2",
-                            "text": "Second post",
-                            "media_type": "TEXT",
-                            "timestamp": "2024-01-14T10:30:00+0000",
-                        },
-                    ]
-                },
-            )
-        )
+        routes["GET", "/v1.0/user_123/threads"] = json_response(_USER_POSTS_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.posts.get_user_posts("user_123")
+        result = transport_client.posts.get_user_posts("user_123")
 
         assert len(result) == 2
         assert result[0].id == "post_1"
         assert result[1].id == "post_2"
-        client.close()
 
-    @respx.mock
-    def test_get_user_posts_with_filters(self):
+    def test_get_user_posts_with_filters(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test getting user posts with time filters."""
-        respx.get(path__regex=r".*/user_123/threads$").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [
-                        {
-                            "id": "post_1",
-                            "text": "Filtered post",
-                            "media_type": "TEXT",
-                            "timestamp": "2024-01-15T10:30:00+0000",
-                        },
-                    ]
-                },
-            )
-        )
+        routes["GET", "/v1.0/user_123/threads"] = json_response(_FILTERED_POSTS_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.posts.get_user_posts(
+        result = transport_client.posts.get_user_posts(
             "user_123",
             since="2024-01-01",
             until="2024-01-31",
@@ -167,218 +170,181 @@ class TestPostsClient:
         )
 
         assert len(result) == 1
-        client.close()
 
-    @respx.mock
-    def test_get_publishing_limit(self):
+    def test_get_publishing_limit(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test getting publishing limit."""
-        respx.get(path__regex=r".*/user_123/threads_publishing_limit.*").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [
-                        {
-                            "quota_usage": 50,
-                            "config": {
-                                "quota_total": 250,
-                                "reply_quota_total": 1000,
-                            },
-                            "reply_quota_usage": 100,
-                        }
-                    ]
-                },
-            )
+        routes["GET", "/v1.0/user_123/threads_publishing_limit"] = json_response(
+            _PUBLISHING_LIMIT_BODY
         )
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.posts.get_publishing_limit("user_123")
+        result = transport_client.posts.get_publishing_limit("user_123")
 
         assert result.quota_usage == 50
         assert result.quota_total == 250
         assert result.reply_quota_usage == 100
         assert result.reply_quota_total == 1000
-        client.close()
 
-    @respx.mock
-    def test_get_publishing_limit_empty_data(self):
+    def test_get_publishing_limit_empty_data(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test getting publishing limit with empty data."""
-        respx.get(path__regex=r".*/user_123/threads_publishing_limit.*").mock(
-            return_value=httpx.Response(
-                200,
-                json={"data": []},
-            )
+        routes["GET", "/v1.0/user_123/threads_publishing_limit"] = json_response(
+            EMPTY_DATA_BODY
         )
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.posts.get_publishing_limit("user_123")
+        result = transport_client.posts.get_publishing_limit("user_123")
 
         assert result.quota_usage == 0
         assert result.quota_total == 250
-        client.close()
 
-    @respx.mock
-    def test_create_and_publish_text(self):
+    def test_create_and_publish_text(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test create and publish text post."""
         # Mock create container - use more specific pattern to not match threads_publish
-        respx.post(path__regex=r"/v1\.0/user_123/threads$").mock(
-            return_value=httpx.Response(200, json={"id": "container_123"})
-        )
+        routes["POST", "/v1.0/user_123/threads"] = json_response(CONTAINER_BODY)
         # Mock publish
-        respx.post(path__regex=r"/v1\.0/user_123/threads_publish$").mock(
-            return_value=httpx.Response(200, json={"id": "post_456"})
+        routes["POST", "/v1.0/user_123/threads_publish"] = json_response(
+            PUBLISHED_POST_ID_BODY
         )
         # Mock get post
-        respx.get(path__regex=r"/v1\.0/post_456.*").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "id": "post_456",
-                    "text": "Hello from SDK",
-                    "media_type": "TEXT",
-                    "timestamp": "2024-01-15T10:30:00+0000",
-                },
-            )
-        )
+        routes["GET", "/v1.0/post_456"] = json_response(_SDK_POST_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.posts.create_and_publish(
+        result = transport_client.posts.create_and_publish(
             user_id="user_123",
             text="Hello from SDK",
         )
 
         assert result.id == "post_456"
         assert result.text == "Hello from SDK"
-        client.close()
 
-    @respx.mock
-    def test_create_and_publish_with_reply_control(self):
+    def test_create_and_publish_with_reply_control(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test create and publish with reply control."""
-        respx.post(path__regex=r"/v1\.0/user_123/threads$").mock(
-            return_value=httpx.Response(200, json={"id": "container_123"})
-        )
-        respx.post(path__regex=r"/v1\.0/user_123/threads_publish$").mock(
-            return_value=httpx.Response(200, json={"id": "post_456"})
-        )
-        respx.get(path__regex=r"/v1\.0/post_456.*").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "id": "post_456",
-                    "text": "Followers only",
-                    "media_type": "TEXT",
-                    "timestamp": "2024-01-15T10:30:00+0000",
-                },
-            )
+        routes["POST", "/v1.0/user_123/threads"] = json_response(CONTAINER_BODY)
+        routes["POST", "/v1.0/user_123/threads_publish"] = json_response(
+            PUBLISHED_POST_ID_BODY
         )
+        routes["GET", "/v1.0/post_456"] = json_response(_FOLLOWERS_ONLY_POST_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.posts.create_and_publish(
+        result = transport_client.posts.create_and_publish(
             user_id="user_123",
             text="Followers only",
             reply_control=ReplyControl.ACCOUNTS_YOU_FOLLOW,
         )
 
         assert result.id == "post_456"
-        client.close()
 
-    def test_create_and_publish_no_content_raises_error(self):
+    def test_create_and_publish_no_content_raises_error(
+        self, fresh_sync_client: ThreadsClient
+    ):
         """Test create and publish with no content raises error."""
-        client = ThreadsClient(access_token="token_123")
         with pytest.raises(ValidationError):
-            client.posts.create_and_publish(user_id="user_123")
-        client.close()
+            fresh_sync_client.posts.create_and_publish(user_id="user_123")
 
 
 class TestWaitForContainer:
     """Tests for container waiting logic."""
 
-    @respx.mock
-    def test_wait_for_container_ready(self):
+    def test_wait_for_container_ready(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test waiting for container that's immediately ready."""
-        respx.post(path__regex=r"/v1\.0/user_123/threads$").mock(
-            return_value=httpx.Response(200, json={"id": "container_123"})
-        )
-        respx.get(path__regex=r"/v1\.0/container_123.*").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "id": "container_123",
-                    "status": "FINISHED",
-                },
-            )
-        )
-        respx.post(path__regex=r"/v1\.0/user_123/threads_publish$").mock(
-            return_value=httpx.Response(200, json={"id": "post_456"})
-        )
-        respx.get(path__regex=r"/v1\.0/post_456.*").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "id": "post_456",
-                    "text": "Video post",
-                    "media_type": "VIDEO",
-                    "timestamp": "2024-01-15T10:30:00+0000",
-                },
-            )
+        routes["POST", "/v1.0/user_123/threads"] = json_response(CONTAINER_BODY)
+        routes["GET", "/v1.0/container_123"] = json_response(CONTAINER_FINISHED_BODY)
+        routes["POST", "/v1.0/user_123/threads_publish"] = json_response(
+            PUBLISHED_POST_ID_BODY
         )
+        routes["GET", "/v1.0/post_456"] = json_response(_VIDEO_POST_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.posts.create_and_publish(
+        result = transport_client.posts.create_and_publish(
             user_id="user_123",
             video_url="https://example.com/video.mp4",
             wait_for_ready=True,
         )
 
         assert result.id == "post_456"
-        client.close()
 
-    @respx.mock
-    def test_wait_for_container_error(self):
-        """Test waiting for container that has error."""
-        respx.post(path__regex=r"/v1\.0/user_123/threads$").mock(
-            return_value=httpx.Response(200, json={"id": "container_123"})
-        )
-        respx.get(path__regex=r"/v1\.0/container_123.*").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "id": "container_123",
-                    "status": "ERROR",
-                    "error_message": "Invalid video format",
-                },
-            )
+    @pytest.mark.respx(assert_all_called=False)
+    def test_wait_for_container_polls_until_ready(
+        self, fresh_sync_client: ThreadsClient, respx_mock: respx.MockRouter
+    ):
+        """Test polling a container that finishes after a retry."""
+        respx_mock.get(url__regex=patterns.CONTAINER_123).mock(
+            side_effect=[
+                json_response(CONTAINER_IN_PROGRESS_BODY),
+                json_response(CONTAINER_FINISHED_BODY),
+            ]
         )
 
-        client = ThreadsClient(access_token="token_123")
-        with pytest.raises(ContainerError, match="Container processing failed"):
-            client.posts.create_and_publish(
-                user_id="user_123",
-                video_url="https://example.com/bad_video.mp4",
-                wait_for_ready=True,
-            )
-        client.close()
-
-    @respx.mock
-    def test_wait_for_container_expired(self):
-        """Test waiting for container that expired."""
-        respx.post(path__regex=r"/v1\.0/user_123/threads$").mock(
-            return_value=httpx.Response(200, json={"id": "container_123"})
+        # fast_sleep keeps the long poll interval from delaying the test
+        status = fresh_sync_client.posts._wait_for_container(
+            "container_123", poll_interval=30.0
         )
-        respx.get(path__regex=r"/v1\.0/container_123.*").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "id": "container_123",
-                    "status": "EXPIRED",
-                },
+
+        assert status.is_ready is True
+        assert respx_mock.calls.call_count == 2
+
+    def test_wait_for_container_timeout(
+        self,
+        transport_client: ThreadsClient,
+        routes: Routes,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test polling gives up at max_wait_time with the last sleep clamped."""
+        routes["GET", "/v1.0/container_123"] = json_response(CONTAINER_IN_PROGRESS_BODY)
+        # A fake clock advanced by sleep, with jitter pinned to the full interval
+        clock = [0.0]
+        sleeps: list[float] = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr(time, "time", lambda: clock[0])
+        monkeypatch.setattr(time, "sleep", fake_sleep)
+        monkeypatch.setattr(random, "uniform", lambda _low, high: high)
+
+        with pytest.raises(ContainerError, match=r"not ready after 5\.0s"):
+            transport_client.posts._wait_for_container(
+                "container_123", poll_interval=1.0, max_wait_time=5.0
             )
-        )
 
-        client = ThreadsClient(access_token="token_123")
-        with pytest.raises(ContainerError, match="Container expired"):
-            client.posts.create_and_publish(
+        # Delays would be 1, 2, 4; the last is clamped to the 2s left
+        assert sleeps == [1.0, 2.0, 2.0]
+
+    def test_poll_delays_back_off_with_jitter(self, fresh_sync_client: ThreadsClient):
+        """Test poll delays double up to the cap, jittered within each step."""
+        delays = fresh_sync_client.posts._poll_delays(1.0, 4.0)
+
+        for low, high in [(0.5, 1.0), (1.0, 2.0), (2.0, 4.0), (2.0, 4.0)]:
+            assert low <= next(delays) <= high
+
+    @pytest.mark.parametrize(
+        ("body", "match"),
+        [
+            (_INVALID_VIDEO_BODY, "Container processing failed"),
+            (_CONTAINER_EXPIRED_BODY, "Container expired"),
+        ],
+        ids=["error", "expired"],
+    )
+    def test_wait_for_container_failure(
+        self,
+        transport_client: ThreadsClient,
+        routes: Routes,
+        body: bytes,
+        match: str,
+    ):
+        """Test waiting for a container that fails or expires."""
+        routes["POST", "/v1.0/user_123/threads"] = json_response(CONTAINER_BODY)
+        routes["GET", "/v1.0/container_123"] = json_response(body)
+
+        with pytest.raises(ContainerError, match=match):
+            transport_client.posts.create_and_publish(
                 user_id="user_123",
                 video_url="https://example.com/video.mp4",
                 wait_for_ready=True,
             )
-        client.close()
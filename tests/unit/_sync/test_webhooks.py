@@ -2,202 +2,189 @@
 
 from __future__ import annotations
 
-import httpx
-import pytest
-import respx
+from collections.abc import Callable
 
+import pytest
+from pydantic_core import to_json
+
+from tests.unit._fixtures import (
+    EMPTY_DATA_BODY,
+    FAILURE_BODY,
+    SUCCESS_BODY,
+    Routes,
+    api_error,
+    assert_fields,
+    json_response,
+)
 from threads import ThreadsClient
+from threads._sync.webhooks import WebhooksClient
 from threads.exceptions import ThreadsAPIError
 
+_SUBSCRIBED_APPS = "/v1.0/me/subscribed_apps"
+_SUBSCRIPTIONS_BODY = to_json(
+    {
+        "data": [
+            {
+                "callback_url": "https://example.com/webhook1",
+                "fields": ["messages"],
+                "active": True,
+            },
+            {
+                "callback_url": "https://example.com/webhook2",
+                "fields": ["messaging_postbacks"],
+                "active": True,
+            },
+        ]
+    }
+)
+
 
 class TestWebhooksClient:
     """Tests for WebhooksClient."""
 
-    @respx.mock
-    def test_subscribe(self):
+    def test_subscribe(self, transport_client: ThreadsClient, routes: Routes):
         """Test subscribing to webhook events."""
-        respx.post("https://graph.threads.net/v1.0/me/subscribed_apps").mock(
-            return_value=httpx.Response(200, json={"success": True})
-        )
+        routes["POST", _SUBSCRIBED_APPS] = json_response(SUCCESS_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.webhooks.subscribe(
+        result = transport_client.webhooks.subscribe(
             callback_url="https://example.com/webhook",
             verify_token="my_verify_token",
         )
 
-        assert result.callback_url == "https://example.com/webhook"
-        assert result.verify_token == "my_verify_token"
-        assert result.active is True
-        client.close()
+        assert_fields(
+            result,
+            callback_url="https://example.com/webhook",
+            verify_token="my_verify_token",
+            active=True,
+        )
 
-    @respx.mock
-    def test_subscribe_with_custom_fields(self):
+    def test_subscribe_with_custom_fields(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test subscribing with custom event fields."""
-        respx.post("https://graph.threads.net/v1.0/me/subscribed_apps").mock(
-            return_value=httpx.Response(200, json={"success": True})
-        )
+        routes["POST", _SUBSCRIBED_APPS] = json_response(SUCCESS_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.webhooks.subscribe(
+        result = transport_client.webhooks.subscribe(
             callback_url="https://example.com/webhook",
             verify_token="my_verify_token",
             fields=["messages", "story_mentions"],
         )
 
-        assert result.fields == ["messages", "story_mentions"]
-        assert result.active is True
-        client.close()
+        assert_fields(result, fields=["messages", "story_mentions"], active=True)
 
-    @respx.mock
-    def test_subscribe_failure(self):
+    def test_subscribe_failure(self, transport_client: ThreadsClient, routes: Routes):
         """Test subscribing when API returns failure."""
-        respx.post("https://graph.threads.net/v1.0/me/subscribed_apps").mock(
-            return_value=httpx.Response(200, json={"success": False})
-        )
+        routes["POST", _SUBSCRIBED_APPS] = json_response(FAILURE_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.webhooks.subscribe(
+        result = transport_client.webhooks.subscribe(
             callback_url="https://example.com/webhook",
             verify_token="my_verify_token",
         )
 
         assert result.active is False
-        client.close()
-
-    @respx.mock
-    def test_subscribe_error(self):
-        """Test subscribing with API error."""
-        respx.post("https://graph.threads.net/v1.0/me/subscribed_apps").mock(
-            return_value=httpx.Response(
-                400,
-                json={
-                    "error": {
-                        "message": "Invalid callback URL",
-                        "type": "ThreadsAPIException",
-                        "code": 100,
-                    }
-                },
-            )
-        )
 
-        client = ThreadsClient(access_token="token_123")
-        with pytest.raises(ThreadsAPIError):
-            client.webhooks.subscribe(
-                callback_url="invalid-url",
-                verify_token="my_verify_token",
-            )
-        client.close()
-
-    @respx.mock
-    def test_unsubscribe(self):
+    def test_unsubscribe(self, transport_client: ThreadsClient, routes: Routes):
         """Test unsubscribing from webhook events."""
-        respx.delete("https://graph.threads.net/v1.0/me/subscribed_apps").mock(
-            return_value=httpx.Response(200, json={"success": True})
-        )
+        routes["DELETE", _SUBSCRIBED_APPS] = json_response(SUCCESS_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.webhooks.unsubscribe()
+        result = transport_client.webhooks.unsubscribe()
 
         assert result is True
-        client.close()
 
-    @respx.mock
-    def test_unsubscribe_failure(self):
+    def test_unsubscribe_failure(self, transport_client: ThreadsClient, routes: Routes):
         """Test unsubscribing when it fails."""
-        respx.delete("https://graph.threads.net/v1.0/me/subscribed_apps").mock(
-            return_value=httpx.Response(200, json={"success": False})
-        )
+        routes["DELETE", _SUBSCRIBED_APPS] = json_response(FAILURE_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.webhooks.unsubscribe()
+        result = transport_client.webhooks.unsubscribe()
 
         assert result is False
-        client.close()
 
-    @respx.mock
-    def test_unsubscribe_error(self):
-        """Test unsubscribing with API error."""
-        respx.delete("https://graph.threads.net/v1.0/me/subscribed_apps").mock(
-            return_value=httpx.Response(
-                401,
-                json={
-                    "error": {
-                        "message": "Invalid access token",
-                        "type": "OAuthException",
-                        "code": 190,
-                    }
-                },
-            )
-        )
-
-        client = ThreadsClient(access_token="token_123")
-        with pytest.raises(ThreadsAPIError):
-            client.webhooks.unsubscribe()
-        client.close()
-
-    @respx.mock
-    def test_get_subscriptions(self):
+    def test_get_subscriptions(self, transport_client: ThreadsClient, routes: Routes):
         """Test getting current subscriptions."""
-        respx.get("https://graph.threads.net/v1.0/me/subscribed_apps").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "data": [
-                        {
-                            "callback_url": "https://example.com/webhook1",
-                            "fields": ["messages"],
-                            "active": True,
-                        },
-                        {
-                            "callback_url": "https://example.com/webhook2",
-                            "fields": ["messaging_postbacks"],
-                            "active": True,
-                        },
-                    ]
-                },
-            )
-        )
+        routes["GET", _SUBSCRIBED_APPS] = json_response(_SUBSCRIPTIONS_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.webhooks.get_subscriptions()
+        result = transport_client.webhooks.get_subscriptions()
 
         assert len(result) == 2
-        assert result[0].callback_url == "https://example.com/webhook1"
-        assert result[0].fields == ["messages"]
+        assert_fields(
+            result[0], callback_url="https://example.com/webhook1", fields=["messages"]
+        )
         assert result[1].callback_url == "https://example.com/webhook2"
-        client.close()
 
-    @respx.mock
-    def test_get_subscriptions_empty(self):
+    def test_get_subscriptions_empty(
+        self, transport_client: ThreadsClient, routes: Routes
+    ):
         """Test getting subscriptions when none exist."""
-        respx.get("https://graph.threads.net/v1.0/me/subscribed_apps").mock(
-            return_value=httpx.Response(200, json={"data": []})
-        )
+        routes["GET", _SUBSCRIBED_APPS] = json_response(EMPTY_DATA_BODY)
 
-        client = ThreadsClient(access_token="token_123")
-        result = client.webhooks.get_subscriptions()
+        result = transport_client.webhooks.get_subscriptions()
 
         assert len(result) == 0
-        client.close()
 
-    @respx.mock
-    def test_get_subscriptions_error(self):
-        """Test getting subscriptions with error."""
-        respx.get("https://graph.threads.net/v1.0/me/subscribed_apps").mock(
-            return_value=httpx.Response(
+    @pytest.mark.parametrize(
+        ("method", "status_code", "error", "call"),
+        [
+            pytest.param(
+                "POST",
+                400,
+                api_error("Invalid callback URL", 100),
+                lambda client: client.webhooks.subscribe(
+                    callback_url="invalid-url",
+                    verify_token="my_verify_token",
+                ),
+                id="subscribe",
+            ),
+            pytest.param(
+                "DELETE",
+                401,
+                api_error("Invalid access token", 190, "OAuthException"),
+                lambda client: client.webhooks.unsubscribe(),
+                id="unsubscribe",
+            ),
+            pytest.param(
+                "GET",
                 500,
-                json={
-                    "error": {
-                        "message": "Internal server error",
-                        "type": "ThreadsAPIException",
-                        "code": 500,
-                    }
-                },
-            )
-        )
+                api_error("Internal server error", 500),
+                lambda client: client.webhooks.get_subscriptions(),
+                id="get_subscriptions",
+            ),
+        ],
+    )
+    def test_api_error(
+        self,
+        transport_client: ThreadsClient,
+        routes: Routes,
+        method: str,
+        status_code: int,
+        error: bytes,
+        call: Callable[[ThreadsClient], object],
+    ):
+        """Test that webhook calls raise on API errors."""
+        routes[method, _SUBSCRIBED_APPS] = json_response(error, status_code)
 
-        client = ThreadsClient(access_token="token_123")
         with pytest.raises(ThreadsAPIError):
-            client.webhooks.get_subscriptions()
-        client.close()
+            call(transport_client)
+
+    def test_verify_challenge(self):
+        """Test verifying a webhook challenge."""
+        params = {
+            "hub.mode": "subscribe",
+            "hub.challenge": "challenge_abc",
+            "hub.verify_token": "my_verify_token",
+        }
+
+        assert (
+            WebhooksClient.verify_challenge(params, "my_verify_token")
+            == "challenge_abc"
+        )
+
+    def test_verify_challenge_rejected(self):
+        """Test rejecting a challenge with a wrong token or mode."""
+        params = {
+            "hub.mode": "subscribe",
+            "hub.challenge": "challenge_abc",
+            "hub.verify_token": "wrong_token",
+        }
+
+        assert WebhooksClient.verify_challenge(params, "my_verify_token") is None
+        assert WebhooksClient.verify_challenge({}, "my_verify_token") is None
@@ -0,0 +1,42 @@
+"""Precompiled respx URL patterns shared by the client tests.
+
+Each pattern matches one Graph API endpoint with any query string.
+"""
+
+import re
+
+from threads.constants import API_BASE_URL, API_VERSION
+
+
+def _endpoint(path: str, *, version: str | None = API_VERSION) -> re.Pattern[str]:
+    """Compile a pattern for an API path, ignoring the query string."""
+    prefix = f"{API_BASE_URL}/{version}" if version else API_BASE_URL
+    return re.compile(rf"^{re.escape(prefix)}/{re.escape(path)}(?:\?|$)")
+
+
+# Auth
+OAUTH_ACCESS_TOKEN = _endpoint("oauth/access_token", version=None)
+ACCESS_TOKEN = _endpoint("access_token")
+REFRESH_ACCESS_TOKEN = _endpoint("refresh_access_token")
+
+# Users
+ME = _endpoint("me")
+USER_123 = _endpoint("user_123")
+USER_456 = _endpoint("user_456")
+NONEXISTENT = _endpoint("nonexistent")
+
+# Posts and media
+POST_123 = _endpoint("post_123")
+USER_123_THREADS = _endpoint("user_123/threads")
+CONTAINER_123 = _endpoint("container_123")
+
+# Insights
+POST_123_INSIGHTS = _endpoint("post_123/insights")
+USER_123_THREADS_INSIGHTS = _endpoint("user_123/threads_insights")
+
+# Replies
+POST_123_REPLIES = _endpoint("post_123/replies")
+REPLY_123_MANAGE_REPLY = _endpoint("reply_123/manage_reply")
+
+# Webhooks
+ME_SUBSCRIBED_APPS = _endpoint("me/subscribed_apps")
@@ -47,10 +47,14 @@ class TestThreadsAPIError:
             status_code=400,
             error_code=100,
         )
-        result = str(error)
-        assert "API Error" in result
-        assert "400" in result
-        assert "100" in result
+        assert str(error) == "API Error | status_code=400 | error_code=100"
+
+    def test_str_reflects_updated_fields(self):
+        error = ThreadsAPIError("API Error", status_code=400)
+        assert str(error) == "API Error | status_code=400"
+
+        error.fbtrace_id = "ABC123"
+        assert str(error) == "API Error | status_code=400 | fbtrace_id=ABC123"
 
 
 class TestRateLimitError:
@@ -63,69 +67,78 @@ class TestRateLimitError:
         )
         assert error.retry_after == 60
 
+    def test_next_delay_uses_retry_after(self):
+        error = RateLimitError("Rate limited", retry_after=60)
+        assert error.next_delay(0) == 60.0
+        assert error.next_delay(5) == 60.0
+
+    def test_next_delay_backoff_is_jittered_and_capped(self):
+        error = RateLimitError("Rate limited")
+        for attempt in range(10):
+            ceiling = min(
+                RateLimitError.BACKOFF_CAP,
+                RateLimitError.BACKOFF_BASE * 2**attempt,
+            )
+            assert 0.0 <= error.next_delay(attempt) <= ceiling
+
+    def test_next_delay_large_attempt_stays_capped(self):
+        error = RateLimitError("Rate limited")
+        assert 0.0 <= error.next_delay(5000) <= RateLimitError.BACKOFF_CAP
+
 
 class TestRaiseForError:
     """Tests for raise_for_error function."""
 
-    def test_authentication_error_401(self):
-        response = {
-            "error": {
-                "message": "Invalid token",
-                "code": 190,
-            }
-        }
-        with pytest.raises(AuthenticationError) as exc_info:
-            raise_for_error(response, 401)
-        assert exc_info.value.status_code == 401
-
-    def test_authentication_error_by_code(self):
-        response = {
-            "error": {
-                "message": "Token expired",
-                "code": 190,
-            }
-        }
-        with pytest.raises(AuthenticationError):
-            raise_for_error(response, 400)
-
-    def test_authorization_error(self):
-        response = {
-            "error": {
-                "message": "Permission denied",
-                "code": 200,
-            }
-        }
-        with pytest.raises(AuthorizationError):
-            raise_for_error(response, 403)
-
-    def test_rate_limit_error(self):
-        response = {
-            "error": {
-                "message": "Too many requests",
-                "code": 4,
-            }
-        }
-        with pytest.raises(RateLimitError):
-            raise_for_error(response, 429)
-
-    def test_not_found_error(self):
-        response = {
-            "error": {
-                "message": "Post not found",
-            }
-        }
-        with pytest.raises(NotFoundError):
-            raise_for_error(response, 404)
-
-    def test_generic_api_error(self):
-        response = {
-            "error": {
-                "message": "Unknown error",
-                "code": 999,
-            }
-        }
-        with pytest.raises(ThreadsAPIError):
-            raise_for_error(response, 500)
+    @pytest.mark.parametrize(
+        ("status_code", "error", "expected"),
+        [
+            pytest.param(
+                401,
+                {"message": "Invalid token", "code": 190},
+                AuthenticationError,
+                id="authentication_401",
+            ),
+            pytest.param(
+                400,
+                {"message": "Token expired", "code": 190},
+                AuthenticationError,
+                id="authentication_by_code",
+            ),
+            pytest.param(
+                403,
+                {"message": "Permission denied", "code": 200},
+                AuthorizationError,
+                id="authorization",
+            ),
+            pytest.param(
+                429,
+                {"message": "Too many requests", "code": 4},
+                RateLimitError,
+                id="rate_limit",
+            ),
+            pytest.param(
+                404,
+                {"message": "Post not found"},
+                NotFoundError,
+                id="not_found",
+            ),
+            pytest.param(
+                500,
+                {"message": "Unknown error", "code": 999},
+                ThreadsAPIError,
+                id="generic",
+            ),
+        ],
+    )
+    def test_raise_for_error(
+        self,
+        status_code: int,
+        error: dict[str, object],
+        expected: type[ThreadsAPIError],
+    ):
+        with pytest.raises(expected) as exc_info:
+            raise_for_error({"error": error}, status_code)
+        assert exc_info.value.status_code == status_code
 
 
 class TestValidationError:
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
 import pytest
 
+from threads._utils import http
 from threads._utils.http import (
     build_url,
     extract_id,
     parse_error_response,
+    parse_json,
     prepare_request_params,
 )
 from threads.exceptions import ThreadsAPIError
@@ -16,26 +23,44 @@ from threads.exceptions import ThreadsAPIError
 class TestBuildUrl:
     """Tests for build_url function."""
 
-    def test_simple_endpoint(self):
-        """Test building URL with simple endpoint."""
-        url = build_url("me/threads")
-
-        assert url == "https://graph.threads.net/v1.0/me/threads"
-
-    def test_endpoint_with_leading_slash(self):
-        """Test building URL with leading slash."""
-        url = build_url("/me/threads")
-
-        assert url == "https://graph.threads.net/v1.0/me/threads"
-
-    def test_endpoint_with_path_params(self):
-        """Test building URL with path parameters."""
-        url = build_url(
-            "{user_id}/threads",
-            path_params={"user_id": "123456"},
-        )
-
-        assert url == "https://graph.threads.net/v1.0/123456/threads"
+    @pytest.mark.parametrize(
+        ("endpoint", "kwargs", "expected"),
+        [
+            pytest.param(
+                "me/threads",
+                {},
+                "https://graph.threads.net/v1.0/me/threads",
+                id="simple",
+            ),
+            pytest.param(
+                "/me/threads",
+                {},
+                "https://graph.threads.net/v1.0/me/threads",
+                id="leading_slash",
+            ),
+            pytest.param(
+                "{user_id}/threads",
+                {"path_params": {"user_id": "123456"}},
+                "https://graph.threads.net/v1.0/123456/threads",
+                id="path_params",
+            ),
+            pytest.param(
+                "me/threads",
+                {"base_url": "https://custom.api.com"},
+                "https://custom.api.com/v1.0/me/threads",
+                id="custom_base_url",
+            ),
+            pytest.param(
+                "me/threads",
+                {"version": "v2.0"},
+                "https://graph.threads.net/v2.0/me/threads",
+                id="custom_version",
+            ),
+        ],
+    )
+    def test_build_url(self, endpoint: str, kwargs: dict[str, Any], expected: str):
+        """Test building URLs without query parameters."""
+        assert build_url(endpoint, **kwargs) == expected
 
     def test_endpoint_with_query_params(self):
         """Test building URL with query parameters."""
@@ -44,8 +69,12 @@ class TestBuildUrl:
             query_params={"access_token": "token123", "fields": "id,text"},
         )
 
-        assert "access_token=token123" in url
-        assert "fields=id%2Ctext" in url or "fields=id,text" in url
+        split = urlsplit(url)
+        assert split.path == "/v1.0/me/threads"
+        assert parse_qs(split.query) == {
+            "access_token": ["token123"],
+            "fields": ["id,text"],
+        }
 
     def test_query_params_none_filtered(self):
         """Test that None values are filtered from query params."""
@@ -54,27 +83,7 @@ class TestBuildUrl:
             query_params={"access_token": "token123", "since": None, "until": None},
         )
 
-        assert "access_token=token123" in url
-        assert "since" not in url
-        assert "until" not in url
-
-    def test_custom_base_url(self):
-        """Test building URL with custom base URL."""
-        url = build_url(
-            "me/threads",
-            base_url="https://custom.api.com",
-        )
-
-        assert url == "https://custom.api.com/v1.0/me/threads"
-
-    def test_custom_version(self):
-        """Test building URL with custom API version."""
-        url = build_url(
-            "me/threads",
-            version="v2.0",
-        )
-
-        assert url == "https://graph.threads.net/v2.0/me/threads"
+        assert parse_qs(urlsplit(url).query) == {"access_token": ["token123"]}
 
 
 class TestParseErrorResponse:
@@ -123,47 +132,54 @@ class TestExtractId:
 class TestPrepareRequestParams:
     """Tests for prepare_request_params function."""
 
-    def test_basic_params(self):
-        """Test preparing basic params."""
-        result = prepare_request_params("token123")
-
-        assert result == {"access_token": "token123"}
-
-    def test_with_extra_params(self):
-        """Test preparing params with extras."""
-        result = prepare_request_params(
-            "token123",
-            extra_params={"fields": "id,text", "limit": 10},
-        )
-
-        assert result == {
-            "access_token": "token123",
-            "fields": "id,text",
-            "limit": 10,
-        }
-
-    def test_extra_params_none_filtered(self):
-        """Test that None values in extra params are filtered."""
-        result = prepare_request_params(
-            "token123",
-            extra_params={"fields": "id,text", "since": None, "until": None},
-        )
-
-        assert result == {
-            "access_token": "token123",
-            "fields": "id,text",
-        }
-        assert "since" not in result
-        assert "until" not in result
-
-    def test_empty_extra_params(self):
-        """Test with empty extra params."""
-        result = prepare_request_params("token123", extra_params={})
-
-        assert result == {"access_token": "token123"}
-
-    def test_none_extra_params(self):
-        """Test with None extra params."""
-        result = prepare_request_params("token123", extra_params=None)
-
-        assert result == {"access_token": "token123"}
+    @pytest.mark.parametrize(
+        ("extra_params", "expected"),
+        [
+            pytest.param(None, {"access_token": "token123"}, id="none"),
+            pytest.param({}, {"access_token": "token123"}, id="empty"),
+            pytest.param(
+                {"fields": "id,text", "limit": 10},
+                {"access_token": "token123", "fields": "id,text", "limit": 10},
+                id="extras",
+            ),
+            pytest.param(
+                {"fields": "id,text", "since": None, "until": None},
+                {"access_token": "token123", "fields": "id,text"},
+                id="none_values_filtered",
+            ),
+        ],
+    )
+    def test_prepare_request_params(
+        self, extra_params: dict[str, Any] | None, expected: dict[str, Any]
+    ):
+        """Test merging extra params with the access token."""
+        assert prepare_request_params("token123", extra_params) == expected
+
+    def test_default_extra_params(self):
+        """Test preparing params without extras."""
+        assert prepare_request_params("token123") == {"access_token": "token123"}
+
+
+class TestParseJson:
+    """Tests for parse_json function."""
+
+    def test_stdlib_fallback(self, monkeypatch: pytest.MonkeyPatch):
+        """Test decoding without orjson installed."""
+        monkeypatch.setattr(http, "_orjson", None)
+        response = httpx.Response(200, json={"id": "123", "ok": True})
+
+        assert parse_json(response) == {"id": "123", "ok": True}
+
+    def test_uses_orjson_when_available(self, monkeypatch: pytest.MonkeyPatch):
+        """Test decoding is delegated to orjson when it is installed."""
+        seen: list[bytes] = []
+
+        def loads(content: bytes) -> dict[str, str]:
+            seen.append(content)
+            return {"id": "123"}
+
+        monkeypatch.setattr(http, "_orjson", SimpleNamespace(loads=loads))
+        response = httpx.Response(200, content=b'{"id": "123"}')
+
+        assert parse_json(response) == {"id": "123"}
+        assert seen == [b'{"id": "123"}']
@@ -1,13 +1,93 @@
 """Tests for Pydantic models."""
 
+import dataclasses
 from datetime import datetime, timedelta
 
+import pytest
+
+import threads.models.auth as auth_module
 from threads.constants import ContainerStatus, MediaType, MetricType
 from threads.models.auth import LongLivedToken, ShortLivedToken
-from threads.models.insights import Insight, InsightsResponse
+from threads.models.insights import (
+    Insight,
+    InsightsResponse,
+    parse_metric,
+    parse_metrics,
+)
 from threads.models.media import MediaContainer, MediaContainerStatus
 from threads.models.post import Post, PublishingLimit
 from threads.models.user import User, UserProfile
+from threads.models.webhook import WebhookVerification
+
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns _NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return _NOW
+
+
+@pytest.fixture
+def frozen_now(monkeypatch: pytest.MonkeyPatch) -> datetime:
+    """Fixture pinning the auth models' clock to a fixed instant."""
+    monkeypatch.setattr(auth_module, "datetime", _FrozenDatetime)
+    return _NOW
+
+
+# Read-only model instances shared across this module so each is validated once
+
+
+@pytest.fixture(scope="module")
+def finished_status() -> MediaContainerStatus:
+    """Fixture providing a finished container status."""
+    return MediaContainerStatus(id="123", status=ContainerStatus.FINISHED)
+
+
+@pytest.fixture(scope="module")
+def error_status() -> MediaContainerStatus:
+    """Fixture providing a failed container status."""
+    return MediaContainerStatus(
+        id="123",
+        status=ContainerStatus.ERROR,
+        error_message="Processing failed",
+    )
+
+
+@pytest.fixture(scope="module")
+def in_progress_status() -> MediaContainerStatus:
+    """Fixture providing an in-progress container status."""
+    return MediaContainerStatus(id="123", status=ContainerStatus.IN_PROGRESS)
+
+
+@pytest.fixture(scope="module")
+def text_post() -> Post:
+    """Fixture providing a text post."""
+    return Post(id="post_123", media_type=MediaType.TEXT, text="Hello, Threads!")
+
+
+@pytest.fixture(scope="module")
+def image_post() -> Post:
+    """Fixture providing an image post."""
+    return Post(
+        id="post_123",
+        media_type=MediaType.IMAGE,
+        media_url="https://example.com/image.jpg",
+    )
+
+
+@pytest.fixture(scope="module")
+def views_insight() -> Insight:
+    """Fixture providing a views insight."""
+    return Insight(name=MetricType.VIEWS, period="lifetime", values=[{"value": 1000}])
+
+
+@pytest.fixture(scope="module")
+def likes_insight() -> Insight:
+    """Fixture providing a likes insight."""
+    return Insight(name=MetricType.LIKES, period="lifetime", values=[{"value": 50}])
 
 
 class TestShortLivedToken:
@@ -21,18 +101,19 @@ class TestShortLivedToken:
         assert token.access_token == "test_token"
         assert token.user_id == "123"
 
-    def test_is_expired_fresh_token(self):
+    def test_is_expired_fresh_token(self, frozen_now: datetime):
         token = ShortLivedToken(
             access_token="test_token",
             user_id="123",
+            created_at=frozen_now,
         )
         assert token.is_expired is False
 
-    def test_is_expired_old_token(self):
+    def test_is_expired_old_token(self, frozen_now: datetime):
         token = ShortLivedToken(
             access_token="test_token",
             user_id="123",
-            created_at=datetime.now() - timedelta(hours=2),
+            created_at=frozen_now - timedelta(hours=2),
         )
         assert token.is_expired is True
 
@@ -52,9 +133,17 @@ class TestLongLivedToken:
         token = LongLivedToken(
             access_token="test_token",
             expires_in=3600,
+            created_at=_NOW,
+        )
+        assert token.expires_at == datetime(2024, 1, 1, 13, 0, 0)
+
+    def test_is_expired(self, frozen_now: datetime):
+        token = LongLivedToken(
+            access_token="test_token",
+            expires_in=3600,
+            created_at=frozen_now - timedelta(hours=1),
         )
-        expected = token.created_at + timedelta(seconds=3600)
-        assert abs((token.expires_at - expected).total_seconds()) < 1
+        assert token.is_expired is True
 
 
 class TestMediaContainer:
@@ -68,53 +157,50 @@ class TestMediaContainer:
 class TestMediaContainerStatus:
     """Tests for MediaContainerStatus model."""
 
-    def test_is_ready_finished(self):
-        status = MediaContainerStatus(
-            id="123",
-            status=ContainerStatus.FINISHED,
-        )
-        assert status.is_ready is True
-        assert status.has_error is False
+    def test_is_ready_finished(self, finished_status: MediaContainerStatus):
+        assert finished_status.is_ready is True
+        assert finished_status.has_error is False
 
-    def test_has_error(self):
-        status = MediaContainerStatus(
-            id="123",
-            status=ContainerStatus.ERROR,
-            error_message="Processing failed",
-        )
-        assert status.is_ready is False
-        assert status.has_error is True
+    def test_has_error(self, error_status: MediaContainerStatus):
+        assert error_status.is_ready is False
+        assert error_status.has_error is True
 
-    def test_in_progress(self):
-        status = MediaContainerStatus(
-            id="123",
-            status=ContainerStatus.IN_PROGRESS,
+    def test_in_progress(self, in_progress_status: MediaContainerStatus):
+        assert in_progress_status.is_ready is False
+        assert in_progress_status.has_error is False
+
+    def test_status_parsed_from_wire_string(self):
+        status = MediaContainerStatus.model_validate(
+            {"id": "123", "status": "FINISHED"}
         )
-        assert status.is_ready is False
-        assert status.has_error is False
+        assert status.status is ContainerStatus.FINISHED
+        assert status.status == "FINISHED"
+        assert status.is_ready is True
 
 
 class TestPost:
     """Tests for Post model."""
 
-    def test_create_text_post(self):
-        post = Post(
-            id="post_123",
-            media_type=MediaType.TEXT,
-            text="Hello, Threads!",
+    def test_create_text_post(self, text_post: Post):
+        assert text_post.id == "post_123"
+        assert text_post.media_type == MediaType.TEXT
+        assert text_post.text == "Hello, Threads!"
+
+    def test_create_image_post(self, image_post: Post):
+        assert image_post.media_type == MediaType.IMAGE
+        assert image_post.media_url == "https://example.com/image.jpg"
+
+    def test_media_product_type_is_interned(self):
+        # Separately built strings, as parse_json hands to model_validate
+        raw = ["".join(["THRE", "ADS"]), "".join(["THREA", "DS"])]
+        assert raw[0] is not raw[1]
+        first, second = (
+            Post.model_validate(
+                {"id": str(i), "media_type": "TEXT", "media_product_type": value}
+            )
+            for i, value in enumerate(raw)
         )
-        assert post.id == "post_123"
-        assert post.media_type == MediaType.TEXT
-        assert post.text == "Hello, Threads!"
-
-    def test_create_image_post(self):
-        post = Post(
-            id="post_123",
-            media_type=MediaType.IMAGE,
-            media_url="https://example.com/image.jpg",
-        )
-        assert post.media_type == MediaType.IMAGE
-        assert post.media_url == "https://example.com/image.jpg"
+        assert first.media_product_type is second.media_product_type
 
 
 class TestPublishingLimit:
@@ -142,17 +228,31 @@ class TestPublishingLimit:
         )
         assert limit.remaining_replies == 500
 
+    def test_remaining_tuple(self):
+        limit = PublishingLimit(
+            quota_usage=100,
+            reply_quota_usage=500,
+            reply_quota_total=1000,
+        )
+        assert limit.remaining == (150, 500)
+
+    def test_remaining_updates_on_assignment(self):
+        limit = PublishingLimit(quota_usage=100)
+        limit.quota_usage = 300
+        assert limit.remaining_posts == 0
+        assert limit.remaining_replies is None
+
+    def test_remaining_without_validation(self):
+        limit = PublishingLimit.model_construct(quota_usage=100, quota_total=250)
+        assert limit.remaining_posts == 150
+        assert limit.model_copy(update={"quota_usage": 240}).remaining_posts == 10
+
 
 class TestInsight:
     """Tests for Insight model."""
 
-    def test_value_property(self):
-        insight = Insight(
-            name=MetricType.VIEWS,
-            period="lifetime",
-            values=[{"value": 1000}],
-        )
-        assert insight.value == 1000
+    def test_value_property(self, views_insight: Insight):
+        assert views_insight.value == 1000
 
     def test_value_empty(self):
         insight = Insight(
@@ -162,29 +262,91 @@ class TestInsight:
         )
         assert insight.value == 0
 
+    def test_value_updates_on_assignment(self):
+        insight = Insight(name=MetricType.VIEWS, values=[{"value": 10}])
+        insight.values = [{"value": 20}]
+        assert insight.value == 20
+
+    def test_value_without_validation(self):
+        insight = Insight.model_construct(name=MetricType.VIEWS, values=[])
+        insight.values.append({"value": 5})
+        assert insight.value == 5
+
+    def test_period_is_interned(self):
+        # Separately built strings, as parse_json hands to model_validate
+        raw = ["".join(["life", "time"]), "".join(["lifet", "ime"])]
+        assert raw[0] is not raw[1]
+        first = Insight.model_validate(
+            {"name": "views", "period": raw[0], "values": []}
+        )
+        second = Insight.model_validate(
+            {"name": "likes", "period": raw[1], "values": []}
+        )
+        assert first.period is second.period
+
 
 class TestInsightsResponse:
     """Tests for InsightsResponse model."""
 
-    def test_get_metrics(self):
-        response = InsightsResponse(
-            data=[
-                Insight(
-                    name=MetricType.VIEWS,
-                    period="lifetime",
-                    values=[{"value": 1000}],
-                ),
-                Insight(
-                    name=MetricType.LIKES,
-                    period="lifetime",
-                    values=[{"value": 50}],
-                ),
-            ]
-        )
+    def test_get_metrics(self, views_insight: Insight, likes_insight: Insight):
+        response = InsightsResponse(data=[views_insight, likes_insight])
         assert response.views == 1000
         assert response.likes == 50
         assert response.replies == 0  # Not in response
 
+    def test_first_duplicate_metric_wins(self):
+        response = InsightsResponse.model_validate(
+            {
+                "data": [
+                    {"name": "views", "values": [{"value": 1}]},
+                    {"name": "views", "values": [{"value": 2}]},
+                ]
+            }
+        )
+        assert response.views == 1
+
+    def test_metrics_follow_data(self, views_insight: Insight):
+        response = InsightsResponse.model_construct(data=[])
+        response.data.append(views_insight)
+        assert response.views == 1000
+
+
+class TestParseMetric:
+    """Tests for parse_metric helper."""
+
+    def test_parse_metric(self):
+        data = {
+            "data": [
+                {"name": "views", "values": [{"value": 1000}]},
+                {"name": "likes", "values": [{"value": 50}]},
+            ]
+        }
+        assert parse_metric(data, MetricType.VIEWS) == 1000
+        assert parse_metric(data, "likes") == 50
+
+    def test_parse_metric_missing(self):
+        data = {"data": [{"name": "views", "values": []}]}
+        assert parse_metric(data, MetricType.VIEWS) == 0
+        assert parse_metric(data, MetricType.LIKES) == 0
+        assert parse_metric({}, MetricType.VIEWS) == 0
+
+    def test_parse_metrics(self):
+        data = {
+            "data": [
+                {"name": "views", "values": [{"value": 1000}]},
+                {"name": "likes", "values": [{"value": 50}]},
+                {"name": "replies", "values": []},
+            ]
+        }
+        assert parse_metrics(
+            data, [MetricType.LIKES, MetricType.REPLIES, "quotes"]
+        ) == {
+            "likes": 50,
+            "replies": 0,
+            "quotes": 0,
+        }
+        assert parse_metrics({}, [MetricType.VIEWS]) == {"views": 0}
+
 
 class TestUser:
     """Tests for User model."""
@@ -211,3 +373,30 @@ class TestUserProfile:
         )
         assert profile.follower_count == 1000
         assert profile.following_count == 500
+
+
+class TestWebhookVerification:
+    """Tests for WebhookVerification dataclass."""
+
+    def test_from_query(self):
+        verification = WebhookVerification.from_query(
+            {
+                "hub.mode": "subscribe",
+                "hub.challenge": "challenge_123",
+                "hub.verify_token": "my_token",
+            }
+        )
+        assert verification.hub_mode == "subscribe"
+        assert verification.hub_challenge == "challenge_123"
+        assert verification.hub_verify_token == "my_token"
+
+    def test_from_query_missing_keys(self):
+        verification = WebhookVerification.from_query({})
+        assert verification == WebhookVerification(
+            hub_mode="", hub_challenge="", hub_verify_token=""
+        )
+
+    def test_frozen(self):
+        verification = WebhookVerification.from_query({"hub.mode": "subscribe"})
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            verification.hub_mode = "unsubscribe"
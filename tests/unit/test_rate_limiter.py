@@ -1,12 +1,32 @@
 """Tests for rate limiting utilities."""
 
-from __future__ import annotations
-
-import time
+import pytest
 
 from threads._utils.rate_limit import AsyncRateLimiter, RateLimiter
 
 
+class FakeClock:
+    """Monotonic clock that only moves when a test advances it."""
+
+    def __init__(self) -> None:
+        self.t = 0.0
+
+    def __call__(self) -> float:
+        return self.t
+
+    def advance(self, seconds: float) -> None:
+        self.t += seconds
+
+    async def async_advance(self, seconds: float) -> None:
+        self.advance(seconds)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Provide a fresh fake clock for each test."""
+    return FakeClock()
+
+
 class TestRateLimiter:
     """Tests for synchronous RateLimiter."""
 
@@ -67,19 +87,28 @@ class TestRateLimiter:
         assert limiter.usage == 0
         assert limiter.remaining == 5
 
-    def test_cleanup_old_timestamps(self):
+    def test_cleanup_old_timestamps(self, clock: FakeClock):
         """Test that old timestamps are cleaned up."""
-        limiter = RateLimiter(max_requests=5, window_seconds=0.1)
+        limiter = RateLimiter(max_requests=5, window_seconds=0.1, time_func=clock)
 
         limiter.record_request()
         limiter.record_request()
         assert limiter.usage == 2
 
-        time.sleep(0.15)  # Wait for window to expire
+        clock.advance(0.15)  # Move past the window
 
         assert limiter.can_proceed() is True
         assert limiter.usage == 0
 
+    def test_window_boundary_expires(self, clock: FakeClock):
+        """Test a timestamp exactly one window old no longer counts."""
+        limiter = RateLimiter(max_requests=1, window_seconds=60.0, time_func=clock)
+
+        limiter.record_request()
+        clock.advance(60.0)
+
+        assert limiter.can_proceed() is True
+
     def test_wait_if_needed_no_wait(self):
         """Test wait_if_needed when no wait is needed."""
         limiter = RateLimiter(max_requests=5, window_seconds=60.0)
@@ -88,18 +117,38 @@ class TestRateLimiter:
 
         assert result == 0.0
 
-    def test_wait_if_needed_waits(self):
-        """Test wait_if_needed actually waits."""
-        limiter = RateLimiter(max_requests=1, window_seconds=0.1)
+    def test_wait_if_needed_waits(self, clock: FakeClock):
+        """Test wait_if_needed sleeps until the window frees up."""
+        limiter = RateLimiter(
+            max_requests=1,
+            window_seconds=0.1,
+            time_func=clock,
+            sleep_func=clock.advance,
+        )
         limiter.record_request()
+        clock.advance(0.04)
 
-        start = time.time()
         result = limiter.wait_if_needed()
-        elapsed = time.time() - start
 
-        # Should have waited approximately 0.1 seconds
-        assert result > 0
-        assert elapsed >= 0.05  # Allow some tolerance
+        assert result == pytest.approx(0.06)
+        assert clock() == pytest.approx(0.1)
+
+    def test_wait_if_needed_releases_lock(self, clock: FakeClock):
+        """Test wait_if_needed does not hold the lock while sleeping."""
+        locked_during_sleep = []
+
+        def sleep(seconds: float) -> None:
+            locked_during_sleep.append(limiter._lock.locked())
+            clock.advance(seconds)
+
+        limiter = RateLimiter(
+            max_requests=1, window_seconds=60.0, time_func=clock, sleep_func=sleep
+        )
+        limiter.record_request()
+
+        limiter.wait_if_needed()
+
+        assert locked_during_sleep == [False]
 
 
 class TestAsyncRateLimiter:
@@ -148,19 +197,28 @@ class TestAsyncRateLimiter:
         limiter.reset()
         assert limiter.remaining == 5
 
-    def test_cleanup_old_timestamps(self):
+    def test_cleanup_old_timestamps(self, clock: FakeClock):
         """Test that old timestamps are cleaned up."""
-        limiter = AsyncRateLimiter(max_requests=5, window_seconds=0.1)
+        limiter = AsyncRateLimiter(max_requests=5, window_seconds=0.1, time_func=clock)
 
         limiter.record_request()
         limiter.record_request()
         assert limiter.remaining == 3
 
-        time.sleep(0.15)  # Wait for window to expire
+        clock.advance(0.15)  # Move past the window
 
         assert limiter.can_proceed() is True
         assert limiter.remaining == 5
 
+    def test_window_boundary_expires(self, clock: FakeClock):
+        """Test a timestamp exactly one window old no longer counts."""
+        limiter = AsyncRateLimiter(max_requests=1, window_seconds=60.0, time_func=clock)
+
+        limiter.record_request()
+        clock.advance(60.0)
+
+        assert limiter.can_proceed() is True
+
     async def test_wait_if_needed_no_wait(self):
         """Test async wait_if_needed when no wait is needed."""
         limiter = AsyncRateLimiter(max_requests=5, window_seconds=60.0)
@@ -169,15 +227,18 @@ class TestAsyncRateLimiter:
 
         assert result == 0.0
 
-    async def test_wait_if_needed_waits(self):
-        """Test async wait_if_needed actually waits."""
-        limiter = AsyncRateLimiter(max_requests=1, window_seconds=0.1)
+    async def test_wait_if_needed_waits(self, clock: FakeClock):
+        """Test async wait_if_needed sleeps until the window frees up."""
+        limiter = AsyncRateLimiter(
+            max_requests=1,
+            window_seconds=0.1,
+            time_func=clock,
+            sleep_func=clock.async_advance,
+        )
         limiter.record_request()
+        clock.advance(0.04)
 
-        start = time.time()
         result = await limiter.wait_if_needed()
-        elapsed = time.time() - start
 
-        # Should have waited approximately 0.1 seconds
-        assert result > 0
-        assert elapsed >= 0.05  # Allow some tolerance
+        assert result == pytest.approx(0.06)
+        assert clock() == pytest.approx(0.1)
@@ -0,0 +1,90 @@
+"""Table-driven tests for parsing raw API responses into models.
+
+These exercise the ``model_validate`` step shared by the sync and async
+clients directly, so the client tests only need to cover HTTP wiring.
+"""
+
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from threads.constants import ContainerStatus, MediaType
+from threads.models.insights import InsightsResponse
+from threads.models.media import MediaContainerStatus
+from threads.models.post import Post
+from threads.models.user import UserProfile
+
+
+@pytest.mark.parametrize(
+    ("model", "raw", "expected"),
+    [
+        pytest.param(
+            Post,
+            {
+                "id": "post_123",
+                "media_product_type": "THREADS",
+                "media_type": "TEXT",
+                "text": "Hello, Threads!",
+                "permalink": "https://threads.net/@user/post/123",
+                "username": "testuser",
+                "is_quote_post": False,
+            },
+            {
+                "id": "post_123",
+                "media_type": MediaType.TEXT,
+                "text": "Hello, Threads!",
+                "username": "testuser",
+                "is_quote_post": False,
+            },
+            id="post",
+        ),
+        pytest.param(
+            MediaContainerStatus,
+            {"id": "container_123", "status": "FINISHED"},
+            {"id": "container_123", "status": ContainerStatus.FINISHED},
+            id="container-finished",
+        ),
+        pytest.param(
+            MediaContainerStatus,
+            {
+                "id": "container_123",
+                "status": "ERROR",
+                "error_message": "Media processing failed",
+            },
+            {
+                "status": ContainerStatus.ERROR,
+                "error_message": "Media processing failed",
+            },
+            id="container-error",
+        ),
+        pytest.param(
+            InsightsResponse,
+            {
+                "data": [
+                    {"name": "views", "values": [{"value": 1000}]},
+                    {"name": "likes", "values": [{"value": 50}]},
+                ]
+            },
+            {"views": 1000, "likes": 50, "replies": 0},
+            id="media-insights",
+        ),
+        pytest.param(
+            UserProfile,
+            {
+                "id": "user_123",
+                "username": "testuser",
+                "name": "Test User",
+                "follower_count": 1000,
+            },
+            {"id": "user_123", "username": "testuser", "follower_count": 1000},
+            id="user-profile",
+        ),
+    ],
+)
+def test_response_parse(
+    model: type[BaseModel], raw: dict[str, Any], expected: dict[str, Any]
+) -> None:
+    parsed = model.model_validate(raw)
+    for attr, value in expected.items():
+        assert getattr(parsed, attr) == value
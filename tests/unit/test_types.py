@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+import pytest
+
 from threads.types import (
     JSON,
     AsyncHTTPClient,
@@ -15,6 +17,105 @@ from threads.types import (
 )
 
 
+class Closeable:
+    def close(self) -> None:
+        pass
+
+
+class NotCloseable:
+    def shutdown(self) -> None:
+        pass
+
+
+class AsyncCloseable:
+    async def aclose(self) -> None:
+        pass
+
+
+class NotAsyncCloseable:
+    def close(self) -> None:
+        pass
+
+
+class MockHTTPClient:
+    def get(
+        self,
+        url: str,
+        *,
+        params: QueryParams | None = None,
+        headers: Headers | None = None,
+    ) -> Any:
+        return {"data": "response"}
+
+    def post(
+        self,
+        url: str,
+        *,
+        data: JSON | None = None,
+        params: QueryParams | None = None,
+        headers: Headers | None = None,
+    ) -> Any:
+        return {"id": "123"}
+
+    def delete(
+        self,
+        url: str,
+        *,
+        params: QueryParams | None = None,
+        headers: Headers | None = None,
+    ) -> Any:
+        return {"success": True}
+
+    def close(self) -> None:
+        pass
+
+
+class PartialClient:
+    def get(self, url: str) -> Any:
+        return {}
+
+
+class MockAsyncHTTPClient:
+    async def get(
+        self,
+        url: str,
+        *,
+        params: QueryParams | None = None,
+        headers: Headers | None = None,
+    ) -> Any:
+        return {"data": "response"}
+
+    async def post(
+        self,
+        url: str,
+        *,
+        data: JSON | None = None,
+        params: QueryParams | None = None,
+        headers: Headers | None = None,
+    ) -> Any:
+        return {"id": "123"}
+
+    async def delete(
+        self,
+        url: str,
+        *,
+        params: QueryParams | None = None,
+        headers: Headers | None = None,
+    ) -> Any:
+        return {"success": True}
+
+    async def aclose(self) -> None:
+        pass
+
+
+class SyncClient:
+    def get(self, url: str) -> Any:
+        return {}
+
+    def close(self) -> None:
+        pass
+
+
 class TestTypeAliases:
     """Tests for type aliases."""
 
@@ -45,156 +146,26 @@ class TestTypeAliases:
         assert params["limit"] == 10
 
 
-class TestSupportsCloseProtocol:
-    """Tests for SupportsClose protocol."""
-
-    def test_object_with_close_matches_protocol(self):
-        """Test that object with close method matches protocol."""
-
-        class Closeable:
-            def close(self) -> None:
-                pass
-
-        obj = Closeable()
-        assert isinstance(obj, SupportsClose)
-
-    def test_object_without_close_does_not_match(self):
-        """Test that object without close method doesn't match."""
-
-        class NotCloseable:
-            def shutdown(self) -> None:
-                pass
-
-        obj = NotCloseable()
-        assert not isinstance(obj, SupportsClose)
-
-
-class TestSupportsAsyncCloseProtocol:
-    """Tests for SupportsAsyncClose protocol."""
-
-    def test_object_with_aclose_matches_protocol(self):
-        """Test that object with aclose method matches protocol."""
-
-        class AsyncCloseable:
-            async def aclose(self) -> None:
-                pass
-
-        obj = AsyncCloseable()
-        assert isinstance(obj, SupportsAsyncClose)
-
-    def test_object_without_aclose_does_not_match(self):
-        """Test that object without aclose method doesn't match."""
-
-        class NotAsyncCloseable:
-            def close(self) -> None:
-                pass
-
-        obj = NotAsyncCloseable()
-        assert not isinstance(obj, SupportsAsyncClose)
-
-
-class TestHTTPClientProtocol:
-    """Tests for HTTPClient protocol."""
-
-    def test_conforming_class_matches_protocol(self):
-        """Test that a conforming class matches HTTPClient protocol."""
-
-        class MockHTTPClient:
-            def get(
-                self,
-                url: str,
-                *,
-                params: QueryParams | None = None,
-                headers: Headers | None = None,
-            ) -> Any:
-                return {"data": "response"}
-
-            def post(
-                self,
-                url: str,
-                *,
-                data: JSON | None = None,
-                params: QueryParams | None = None,
-                headers: Headers | None = None,
-            ) -> Any:
-                return {"id": "123"}
-
-            def delete(
-                self,
-                url: str,
-                *,
-                params: QueryParams | None = None,
-                headers: Headers | None = None,
-            ) -> Any:
-                return {"success": True}
-
-            def close(self) -> None:
-                pass
-
-        client = MockHTTPClient()
-        assert isinstance(client, HTTPClient)
-
-    def test_partial_implementation_does_not_match(self):
-        """Test that partial implementation doesn't match."""
-
-        class PartialClient:
-            def get(self, url: str) -> Any:
-                return {}
-
-        client = PartialClient()
-        assert not isinstance(client, HTTPClient)
-
-
-class TestAsyncHTTPClientProtocol:
-    """Tests for AsyncHTTPClient protocol."""
-
-    def test_conforming_class_matches_protocol(self):
-        """Test that a conforming class matches AsyncHTTPClient protocol."""
-
-        class MockAsyncHTTPClient:
-            async def get(
-                self,
-                url: str,
-                *,
-                params: QueryParams | None = None,
-                headers: Headers | None = None,
-            ) -> Any:
-                return {"data": "response"}
-
-            async def post(
-                self,
-                url: str,
-                *,
-                data: JSON | None = None,
-                params: QueryParams | None = None,
-                headers: Headers | None = None,
-            ) -> Any:
-                return {"id": "123"}
-
-            async def delete(
-                self,
-                url: str,
-                *,
-                params: QueryParams | None = None,
-                headers: Headers | None = None,
-            ) -> Any:
-                return {"success": True}
-
-            async def aclose(self) -> None:
-                pass
-
-        client = MockAsyncHTTPClient()
-        assert isinstance(client, AsyncHTTPClient)
-
-    def test_sync_client_does_not_match_async_protocol(self):
-        """Test that sync client doesn't match async protocol."""
-
-        class SyncClient:
-            def get(self, url: str) -> Any:
-                return {}
-
-            def close(self) -> None:
-                pass
-
-        client = SyncClient()
-        assert not isinstance(client, AsyncHTTPClient)
+class TestProtocols:
+    """Tests for runtime-checkable protocols."""
+
+    @pytest.mark.parametrize(
+        ("obj", "protocol", "expected"),
+        [
+            pytest.param(Closeable(), SupportsClose, True, id="close"),
+            pytest.param(NotCloseable(), SupportsClose, False, id="no-close"),
+            pytest.param(AsyncCloseable(), SupportsAsyncClose, True, id="aclose"),
+            pytest.param(
+                NotAsyncCloseable(), SupportsAsyncClose, False, id="no-aclose"
+            ),
+            pytest.param(MockHTTPClient(), HTTPClient, True, id="http-client"),
+            pytest.param(PartialClient(), HTTPClient, False, id="partial-client"),
+            pytest.param(
+                MockAsyncHTTPClient(), AsyncHTTPClient, True, id="async-http-client"
+            ),
+            pytest.param(SyncClient(), AsyncHTTPClient, False, id="sync-client"),
+        ],
+    )
+    def test_isinstance(self, obj: object, protocol: type, expected: bool):
+        """Test structural matching against each protocol."""
+        assert isinstance(obj, protocol) is expected
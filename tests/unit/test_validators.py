@@ -3,6 +3,7 @@
 import pytest
 
 from threads._utils.validators import (
+    MAX_TEXT_LENGTH,
     validate_carousel_items,
     validate_country_codes,
     validate_media_url,
@@ -12,53 +13,56 @@ from threads._utils.validators import (
 from threads.constants import MediaType
 from threads.exceptions import ValidationError
 
+_MAX_LENGTH_TEXT = "a" * MAX_TEXT_LENGTH
+_TOO_LONG_TEXT = _MAX_LENGTH_TEXT + "a"
+
 
 class TestValidateTextLength:
     """Tests for text length validation."""
 
-    def test_valid_text(self):
-        validate_text_length("Hello, Threads!")
-
-    def test_none_text(self):
-        validate_text_length(None)
-
-    def test_max_length_text(self):
-        text = "a" * 500
+    @pytest.mark.parametrize("text", ["Hello, Threads!", None, _MAX_LENGTH_TEXT])
+    def test_valid(self, text: str | None):
         validate_text_length(text)
 
     def test_exceeds_max_length(self):
-        text = "a" * 501
-        with pytest.raises(ValidationError) as exc_info:
-            validate_text_length(text)
-        assert "exceeds maximum length" in str(exc_info.value)
+        with pytest.raises(ValidationError, match="exceeds maximum length"):
+            validate_text_length(_TOO_LONG_TEXT)
 
 
 class TestValidateMediaUrl:
     """Tests for media URL validation."""
 
-    def test_valid_image_url(self):
-        validate_media_url("https://example.com/image.jpg", MediaType.IMAGE)
-
-    def test_valid_video_url(self):
-        validate_media_url("https://example.com/video.mp4", MediaType.VIDEO)
-
-    def test_none_for_text(self):
-        validate_media_url(None, MediaType.TEXT)
-
-    def test_none_required_for_image(self):
-        with pytest.raises(ValidationError) as exc_info:
-            validate_media_url(None, MediaType.IMAGE)
-        assert "required" in str(exc_info.value)
-
-    def test_invalid_scheme(self):
-        with pytest.raises(ValidationError) as exc_info:
-            validate_media_url("ftp://example.com/image.jpg", MediaType.IMAGE)
-        assert "http or https" in str(exc_info.value)
-
-    def test_invalid_image_format(self):
-        with pytest.raises(ValidationError) as exc_info:
-            validate_media_url("https://example.com/image.bmp", MediaType.IMAGE)
-        assert "Unsupported image format" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        ("url", "media_type"),
+        [
+            ("https://example.com/image.jpg", MediaType.IMAGE),
+            ("https://example.com/video.mp4", MediaType.VIDEO),
+            (None, MediaType.TEXT),
+        ],
+    )
+    def test_valid(self, url: str | None, media_type: MediaType):
+        validate_media_url(url, media_type)
+
+    @pytest.mark.parametrize(
+        ("url", "media_type", "message"),
+        [
+            (None, MediaType.IMAGE, "required"),
+            ("ftp://example.com/image.jpg", MediaType.IMAGE, "http or https"),
+            (
+                "https://example.com/image.bmp",
+                MediaType.IMAGE,
+                "Unsupported image format",
+            ),
+            (
+                "https://example.com/clip.avi",
+                MediaType.VIDEO,
+                "Unsupported video format",
+            ),
+        ],
+    )
+    def test_invalid(self, url: str | None, media_type: MediaType, message: str):
+        with pytest.raises(ValidationError, match=message):
+            validate_media_url(url, media_type)
 
 
 class TestValidateCarouselItems:
@@ -84,39 +88,35 @@ class TestValidateCarouselItems:
 class TestValidateReplyControl:
     """Tests for reply control validation."""
 
-    def test_valid_everyone(self):
-        validate_reply_control("EVERYONE")
-
-    def test_valid_accounts_you_follow(self):
-        validate_reply_control("ACCOUNTS_YOU_FOLLOW")
-
-    def test_valid_mentioned_only(self):
-        validate_reply_control("MENTIONED_ONLY")
+    @pytest.mark.parametrize(
+        "value", ["EVERYONE", "ACCOUNTS_YOU_FOLLOW", "MENTIONED_ONLY", None]
+    )
+    def test_valid(self, value: str | None):
+        validate_reply_control(value)
 
-    def test_none_value(self):
-        validate_reply_control(None)
-
-    def test_invalid_value(self):
-        with pytest.raises(ValidationError) as exc_info:
-            validate_reply_control("invalid")
-        assert "Invalid reply_control" in str(exc_info.value)
+    @pytest.mark.parametrize("value", ["invalid", "everyone"])
+    def test_invalid(self, value: str):
+        with pytest.raises(ValidationError, match="Invalid reply_control"):
+            validate_reply_control(value)
 
 
 class TestValidateCountryCodes:
     """Tests for country code validation."""
 
-    def test_valid_codes(self):
-        validate_country_codes(["US", "GB", "CA"])
-
-    def test_none_codes(self):
-        validate_country_codes(None)
-
-    def test_invalid_lowercase(self):
-        with pytest.raises(ValidationError) as exc_info:
-            validate_country_codes(["us", "gb"])
-        assert "Invalid ISO country codes" in str(exc_info.value)
-
-    def test_invalid_length(self):
-        with pytest.raises(ValidationError) as exc_info:
-            validate_country_codes(["USA"])
-        assert "2-letter uppercase" in str(exc_info.value)
+    @pytest.mark.parametrize("codes", [["US", "GB", "CA"], [], None])
+    def test_valid(self, codes: list[str] | None):
+        validate_country_codes(codes)
+
+    @pytest.mark.parametrize(
+        ("codes", "message"),
+        [
+            (["us", "gb"], "Invalid ISO country codes"),
+            (["USA"], "2-letter uppercase"),
+            (["US\n"], "Invalid ISO country codes"),
+            (["US,GB"], "Invalid ISO country codes"),
+            (["US", "gb"], "Invalid ISO country codes: gb"),
+        ],
+    )
+    def test_invalid(self, codes: list[str], message: str):
+        with pytest.raises(ValidationError, match=message):
+            validate_country_codes(codes)